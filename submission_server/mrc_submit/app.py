@@ -1,61 +1,104 @@
 from __future__ import annotations
 
+import asyncio
+from collections import Counter
 from datetime import date, datetime, time, timedelta
+from email.utils import parsedate
+from functools import lru_cache
+from itertools import chain
+import hashlib
 import html
 import json
 import mimetypes
 import os
+import re
+import shutil
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 from urllib.parse import urlencode
 from zoneinfo import ZoneInfo
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, File, Form, HTTPException, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, RedirectResponse, Response, StreamingResponse
+from fastapi.staticfiles import StaticFiles
 
 from .boards import generate_boards_from_xlsx, load_boards_json, parse_carddeck, write_boards_json
 from .cards import CARDS, CARDS_BY_TYPE
 from .config import load_settings
 from .jobs import run_publish
 from .label_map import build_label_map
-from .storage import Storage, new_submission_id, utc_now_iso
+from .storage import Storage, StoredFile, new_submission_id, utc_now_iso
 from .validation import RunPayload, evaluate_card, normalize_claim_labels, normalize_tier, tier_value, validate_claim_labels
 
 
 DEFAULT_SEED = "2025W"
 ADMIN_COOKIE_NAME = "mrc_admin"
+# Admin pages are server-rendered and only loaded same-origin, so they never need CORS headers.
+CORS_EXEMPT_PATHS = frozenset({"/admin", "/favicon.ico"})
+CORS_EXEMPT_PREFIX = "/admin/"
+
+
+class _ApiCORSMiddleware(CORSMiddleware):
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http":
+            path = scope["path"]
+            if path in CORS_EXEMPT_PATHS or path.startswith(CORS_EXEMPT_PREFIX):
+                await self.app(scope, receive, send)
+                return
+        await super().__call__(scope, receive, send)
+
+
+TRUTHY_VALUES = frozenset({"1", "true", "t", "yes", "y", "on"})
+ENV_FLAG_VALUES = frozenset({"1", "true", "yes", "on"})
+TOKEN_EVENTS = frozenset({None, "earned", "seal", "shield"})
+SPEND_TOKEN_EVENTS = frozenset({"seal", "shield"})
+SEAL_TYPES = frozenset({"B", "C"})
+REVIEW_STATUSES = frozenset({"approved", "rejected", "pending"})
+IMAGE_SUFFIXES = frozenset({".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp"})
+
+
+def _as_text(value: Any) -> str:
+    return value.strip() if type(value) is str else str(value).strip()
 
 
 def _parse_bool(value: Any) -> bool:
+    if type(value) is str:
+        return value.strip().lower() in TRUTHY_VALUES
     if value is None:
         return False
     if isinstance(value, bool):
         return value
     if isinstance(value, (int, float)):
         return value != 0
-    text = str(value).strip().lower()
-    return text in ("1", "true", "t", "yes", "y", "on")
+    return _as_text(value).lower() in TRUTHY_VALUES
 
 
 def _parse_int(value: Any) -> int | None:
     if value is None:
         return None
-    text = str(value).strip()
-    if text == "":
+    text = _as_text(value)
+    if not text:
         return None
     try:
-        return int(float(text))
+        return int(text)
     except ValueError:
+        pass
+    try:
+        return int(float(text))
+    except (ValueError, OverflowError):
         return None
 
 
 def _parse_float(value: Any) -> float | None:
     if value is None:
         return None
-    text = str(value).strip().replace(",", "")
-    if text == "":
+    text = _as_text(value)
+    if "," in text:
+        text = text.replace(",", "")
+    if not text:
         return None
     try:
         return float(text)
@@ -66,7 +109,7 @@ def _parse_float(value: Any) -> float | None:
 def _parse_date(value: Any) -> date | None:
     if value is None:
         return None
-    text = str(value).strip()
+    text = _as_text(value)
     if not text:
         return None
     try:
@@ -78,7 +121,7 @@ def _parse_date(value: Any) -> date | None:
 def _parse_time(value: Any) -> time | None:
     if value is None:
         return None
-    text = str(value).strip()
+    text = _as_text(value)
     if not text:
         return None
     try:
@@ -87,62 +130,231 @@ def _parse_time(value: Any) -> time | None:
         return None
 
 
+def _parse_precipitation(value: Any) -> str:
+    return str(value or "none").strip().lower() or "none"
+
+
+# RunPayload fields read straight from the submit form; tier and group_tiers are validated separately.
+RUN_FORM_FIELDS: tuple[tuple[str, Callable[[Any], Any]], ...] = (
+    ("run_date", _parse_date),
+    ("start_time", _parse_time),
+    ("distance_km", _parse_float),
+    ("duration_min", _parse_int),
+    ("temperature_c", _parse_float),
+    ("feels_like_c", _parse_float),
+    ("wind_m_s", _parse_float),
+    ("precipitation", _parse_precipitation),
+    ("is_track", _parse_bool),
+    ("is_treadmill", _parse_bool),
+    ("elevation_gain_m", _parse_int),
+    ("hill_repeats", _parse_int),
+    ("has_light_gear", _parse_bool),
+    ("is_silent", _parse_bool),
+    ("with_new_runner", _parse_bool),
+    ("did_warmup", _parse_bool),
+    ("did_cooldown", _parse_bool),
+    ("did_foam_roll", _parse_bool),
+    ("did_strength", _parse_bool),
+    ("did_drills", _parse_bool),
+    ("did_log", _parse_bool),
+    ("is_new_route", _parse_bool),
+    ("is_build_up", _parse_bool),
+    ("is_pacing", _parse_bool),
+    ("is_level_mix", _parse_bool),
+    ("is_group", _parse_bool),
+    ("group_size", _parse_int),
+    ("day_runners_count", _parse_int),
+    ("is_thursday_meeting", _parse_bool),
+    ("is_bungae", _parse_bool),
+    ("is_host", _parse_bool),
+    ("after_social", _parse_bool),
+    ("is_easy", _parse_bool),
+)
+
+
+@lru_cache(maxsize=4)
+def _zone(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
+
+def _job_tz() -> ZoneInfo:
+    return _zone(os.getenv("MRC_JOB_TIMEZONE", "Asia/Seoul"))
+
+
+def _boards_path(storage_dir: Path) -> Path:
+    env_path = os.getenv("MRC_BOARDS_PATH")
+    return Path(env_path) if env_path else storage_dir / "boards" / "boards.json"
+
+
 def _client_ip(request: Request) -> str | None:
-    xff = request.headers.get("x-forwarded-for")
+    scope = request.scope
+    xff = _scope_header(scope, b"x-forwarded-for")
     if xff:
-        return xff.split(",")[0].strip()
-    if request.client:
-        return request.client.host
+        first = xff.split(b",", 1)[0].strip()
+        if first:
+            return first.decode("latin-1")
+    client = scope.get("client")
+    if client:
+        return client[0]
     return None
 
 
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _latest_upload(boards_dir: Path) -> Path | None:
+    latest = None
+    latest_mtime = -1
+    try:
+        entries = os.scandir(boards_dir)
+    except OSError:
+        return None
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if not (name.startswith("upload-") and name.endswith(".xlsx")) or not entry.is_file():
+                continue
+            mtime = entry.stat().st_mtime_ns
+            if mtime > latest_mtime:
+                latest, latest_mtime = entry.path, mtime
+    return Path(latest) if latest else None
+
+
 def _load_board_codes(storage_dir: Path, *, carddeck_path: Path, seed: str, map_labels: bool) -> dict[str, set[str]]:
-    env_path = os.getenv("MRC_BOARDS_PATH")
-    boards_path = Path(env_path) if env_path else storage_dir / "boards" / "boards.json"
-    data = load_boards_json(
-        boards_path,
-        carddeck_path=carddeck_path,
+    boards_path = _boards_path(storage_dir)
+    return _cached_board_codes(
+        str(boards_path),
+        _mtime_ns(boards_path),
+        str(carddeck_path),
+        _mtime_ns(carddeck_path),
+        seed,
+        map_labels,
+    )
+
+
+@lru_cache(maxsize=8)
+def _load_json_cached(path: str, mtime_ns: int) -> Any:
+    # Keyed on mtime so a rewritten file is picked up; callers must not mutate the result.
+    # Missing or invalid files raise and are therefore never cached.
+    return json.loads(Path(path).read_bytes())
+
+
+@lru_cache(maxsize=4)
+def _cached_boards_payload(
+    boards_path: str,
+    boards_mtime_ns: int,
+    carddeck_path: str,
+    carddeck_mtime_ns: int,
+    seed: str,
+    map_labels: bool,
+) -> dict[str, Any] | None:
+    return load_boards_json(
+        Path(boards_path),
+        carddeck_path=Path(carddeck_path),
         label_seed=seed,
         apply_label_map=map_labels,
     )
+
+
+HEALTHZ_BODY = b'{"status":"ok"}'
+
+
+def _encode_json(data: Any) -> bytes:
+    # Same encoding JSONResponse uses, so cached bodies are byte-identical to the uncached ones.
+    return json.dumps(data, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+@lru_cache(maxsize=4)
+def _cached_boards_body(
+    boards_path: str,
+    boards_mtime_ns: int,
+    carddeck_path: str,
+    carddeck_mtime_ns: int,
+    seed: str,
+    map_labels: bool,
+) -> bytes | None:
+    data = _cached_boards_payload(boards_path, boards_mtime_ns, carddeck_path, carddeck_mtime_ns, seed, map_labels)
+    return _encode_json(data) if data else None
+
+
+@lru_cache(maxsize=4)
+def _cached_json_body(path: str, mtime_ns: int) -> bytes:
+    return _encode_json(_load_json_cached(path, mtime_ns))
+
+
+@lru_cache(maxsize=8)
+def _cached_cards_body(seed: str) -> bytes:
+    label_map = build_label_map(seed)
+    return _encode_json(
+        {
+            "seed": seed,
+            "cards": [
+                {
+                    "code": c.code,
+                    "type": c.card_type,
+                    "stars": c.stars,
+                    "name": c.name,
+                    "label": label_map.by_id.get(c.code),
+                }
+                for c in CARDS.values()
+            ],
+            "by_type": CARDS_BY_TYPE,
+            "label_map": label_map.by_id,
+        }
+    )
+
+
+@lru_cache(maxsize=8)
+def _cached_board_codes(
+    boards_path: str,
+    boards_mtime_ns: int,
+    carddeck_path: str,
+    carddeck_mtime_ns: int,
+    seed: str,
+    map_labels: bool,
+) -> dict[str, set[str]]:
+    data = _cached_boards_payload(boards_path, boards_mtime_ns, carddeck_path, carddeck_mtime_ns, seed, map_labels)
     if not data:
         return {}
+    boards = data.get("boards") if isinstance(data, dict) else None
     result: dict[str, set[str]] = {}
-    for board in data.get("boards", []) if isinstance(data, dict) else []:
-        name = (board or {}).get("name")
-        if not name:
+    for board in boards or ():
+        if not isinstance(board, dict) or not board.get("name"):
             continue
-        grid = (board or {}).get("grid", [])
-        codes = {
-            cell.get("code")
-            for row in grid
-            for cell in (row or [])
-            if isinstance(cell, dict) and cell.get("code")
-        }
+        cells = chain.from_iterable(row or () for row in board.get("grid") or ())
+        codes = {code for cell in cells if isinstance(cell, dict) and (code := cell.get("code"))}
         if codes:
-            result[name] = codes
+            result[board["name"]] = codes
     return result
 
 
+TIER_LABELS = {"beginner": "초보", "intermediate": "중수", "advanced": "고수"}
+TIER_FROM_LABEL = {
+    **{tier: tier for tier in TIER_LABELS},
+    **{label: tier for tier, label in TIER_LABELS.items()},
+}
+STATUS_LABELS = {"pending": "대기", "approved": "승인", "rejected": "반려", "all": "전체"}
+CARD_STATUS_LABELS = {"passed": "통과", "failed": "실패", "needs_review": "확인 필요"}
+CARD_REVIEW_LABELS = {"approved": "승인", "rejected": "반려", "pending": "대기"}
+WEEKDAY_LABELS = "월화수목금토일"
+
+
 def _normalize_tier_label(value: str) -> str | None:
     raw = (value or "").strip()
     if not raw:
         return None
-    lowered = raw.lower()
-    if lowered in ("beginner", "intermediate", "advanced"):
-        return lowered
-    mapping = {"초보": "beginner", "중수": "intermediate", "고수": "advanced"}
-    return mapping.get(raw)
+    return TIER_FROM_LABEL.get(raw.lower())
 
 
 def _load_tier_from_boards(storage_dir: Path, player_name: str) -> str | None:
-    env_path = os.getenv("MRC_BOARDS_PATH")
-    boards_path = Path(env_path) if env_path else storage_dir / "boards" / "boards.json"
-    if not boards_path.exists():
-        return None
+    boards_path = _boards_path(storage_dir)
     try:
-        data = json.loads(boards_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+        data = _load_json_cached(str(boards_path), boards_path.stat().st_mtime_ns)
+    except (OSError, ValueError):
         return None
     for board in data.get("boards", []) if isinstance(data, dict) else []:
         if (board or {}).get("name") != player_name:
@@ -171,36 +383,50 @@ def _require_admin(settings, request: Request, form: dict | None = None) -> str:
     return key
 
 
+def _scope_header(scope: dict[str, Any], name: bytes) -> bytes | None:
+    for key, value in scope.get("headers") or ():
+        if key == name:
+            return value
+    return None
+
+
 def _is_secure_request(request: Request) -> bool:
-    if request.url.scheme == "https":
+    scope = request.scope
+    if scope.get("scheme") == "https":
         return True
-    forwarded_proto = request.headers.get("x-forwarded-proto", "")
+    forwarded_proto = _scope_header(scope, b"x-forwarded-proto")
     if forwarded_proto:
-        return forwarded_proto.split(",")[0].strip().lower() == "https"
+        return forwarded_proto.split(b",", 1)[0].strip().lower() == b"https"
     return False
 
 
-async def _read_upload_limited(upload: UploadFile, *, max_bytes: int) -> bytes:
-    data = bytearray()
+async def _read_upload_limited(upload: UploadFile, *, max_bytes: int, dest: Path) -> int:
+    total = 0
     chunk_size = 1024 * 1024
-    while True:
-        chunk = await upload.read(chunk_size)
-        if not chunk:
-            break
-        data.extend(chunk)
-        if len(data) > max_bytes:
-            raise HTTPException(status_code=413, detail=f"파일이 너무 큽니다: {upload.filename}")
-    return bytes(data)
+    try:
+        fh = await run_in_threadpool(open, dest, "wb")
+        try:
+            while True:
+                chunk = await upload.read(chunk_size)
+                if not chunk:
+                    break
+                total += len(chunk)
+                if total > max_bytes:
+                    raise HTTPException(status_code=413, detail=f"파일이 너무 큽니다: {upload.filename}")
+                await run_in_threadpool(fh.write, chunk)
+        finally:
+            await run_in_threadpool(fh.close)
+    except BaseException:
+        dest.unlink(missing_ok=True)
+        raise
+    return total
+
+
+CSVISH_SPLIT = re.compile(r"[,\n]+")
 
 
 def _split_csvish(raw: list[str]) -> list[str]:
-    out: list[str] = []
-    for item in raw:
-        if not item:
-            continue
-        parts = [p.strip() for p in str(item).replace("\n", ",").split(",")]
-        out.extend([p for p in parts if p])
-    return out
+    return [part for item in raw if item for piece in CSVISH_SPLIT.split(str(item)) if (part := piece.strip())]
 
 
 def _validation_summary(validation: dict | list) -> str:
@@ -210,20 +436,46 @@ def _validation_summary(validation: dict | list) -> str:
         cards = validation
     if not cards:
         return "-"
-    passed = sum(1 for v in cards if v.get("status") == "passed")
-    failed = sum(1 for v in cards if v.get("status") == "failed")
-    needs = sum(1 for v in cards if v.get("status") == "needs_review")
-    return f"통과 {passed} / 실패 {failed} / 확인 {needs}"
+    counts = Counter(v.get("status") for v in cards)
+    return f"통과 {counts['passed']} / 실패 {counts['failed']} / 확인 {counts['needs_review']}"
 
 
 def _load_card_titles(carddeck_path: Path) -> dict[str, str]:
+    return _cached_card_titles(str(carddeck_path), _mtime_ns(carddeck_path))
+
+
+@lru_cache(maxsize=8)
+def _cached_card_titles(carddeck_path: str, mtime_ns: int) -> dict[str, str]:
     try:
-        cards = parse_carddeck(carddeck_path)
+        cards = parse_carddeck(Path(carddeck_path))
     except (FileNotFoundError, OSError, ValueError):
         return {}
     return {code: card.title for code, card in cards.items()}
 
 
+@lru_cache(maxsize=32)
+def _review_status_span(status: str) -> str:
+    return (
+        f'<span class="card-status card-status--review-{html.escape(status)}">'
+        f"{html.escape(_card_review_label(status))}</span>"
+    )
+
+
+@lru_cache(maxsize=32)
+def _card_status_span(status: str) -> str:
+    return f'<span class="card-status card-status--{html.escape(status)}">{html.escape(_card_status_label(status))}</span>'
+
+
+@lru_cache(maxsize=256)
+def _card_title_span(title: str) -> str:
+    return f'<span class="card-title">{html.escape(title)}</span>'
+
+
+@lru_cache(maxsize=8)
+def _reject_badge(reason: str) -> str:
+    return f'<div class="review-badge review-badge--rejected">{html.escape(reason)}</div>'
+
+
 def _format_card_list(
     validation: dict | list,
     card_titles: dict[str, str],
@@ -238,13 +490,9 @@ def _format_card_list(
         items = []
         for code in fallback_codes:
             title = card_titles.get(code, "")
-            title_html = f' <span class="card-title">{html.escape(title)}</span>' if title else ""
+            title_html = f" {_card_title_span(title)}" if title else ""
             review_status = (review_cards or {}).get(code)
-            review_html = (
-                f' <span class="card-status card-status--review-{html.escape(review_status)}">{html.escape(_card_review_label(review_status))}</span>'
-                if review_status
-                else ""
-            )
+            review_html = f" {_review_status_span(review_status)}" if review_status else ""
             items.append(f"<li><span class=\"card-code\">{html.escape(code)}</span>{title_html}{review_html}</li>")
         return f"<ul class=\"card-list\">{''.join(items)}</ul>"
 
@@ -254,32 +502,48 @@ def _format_card_list(
         resolved = item.get("resolved_code") or item.get("label") or ""
         title = card_titles.get(resolved) or card_titles.get(label) or ""
         status = item.get("status")
-        status_text = _card_status_label(status)
         review_status = (review_cards or {}).get(resolved) or (review_cards or {}).get(label)
-        review_html = (
-            f' <span class="card-status card-status--review-{html.escape(review_status)}">{html.escape(_card_review_label(review_status))}</span>'
-            if review_status
-            else ""
-        )
-        status_html = (
-            f' <span class="card-status card-status--{html.escape(status)}">{html.escape(status_text)}</span>'
-            if status
-            else ""
-        )
-        title_html = f' <span class="card-title">{html.escape(title)}</span>' if title else ""
+        review_html = f" {_review_status_span(review_status)}" if review_status else ""
+        status_html = f" {_card_status_span(status)}" if status else ""
+        title_html = f" {_card_title_span(title)}" if title else ""
         items.append(
             f"<li><span class=\"card-code\">{html.escape(label)}</span>{title_html}{status_html}{review_html}</li>"
         )
     return f"<ul class=\"card-list\">{''.join(items)}</ul>"
 
 
+# Stored submission files never change after upload, but they sit behind the admin key.
+SUBMISSION_FILE_CACHE_CONTROL = "private, max-age=86400, immutable"
+NOT_MODIFIED_HEADERS = ("etag", "last-modified", "cache-control")
+
+
+@lru_cache(maxsize=64)
+def _media_type(suffix: str) -> str:
+    media_type, _ = mimetypes.guess_type(f"file{suffix}")
+    return media_type or "application/octet-stream"
+
+
+def _is_not_modified(request: Request, response: Response) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        if if_none_match.strip() == "*":
+            return True
+        etag = response.headers.get("etag")
+        return etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    if_modified_since = request.headers.get("if-modified-since")
+    last_modified = response.headers.get("last-modified")
+    if if_modified_since and last_modified:
+        since = parsedate(if_modified_since)
+        modified = parsedate(last_modified)
+        return since is not None and modified is not None and since >= modified
+    return False
+
+
 def _load_submission_meta(storage: Storage, submission_id: str) -> dict[str, Any] | None:
     meta_path = storage.submissions_dir / submission_id / "meta.json"
-    if not meta_path.exists():
-        return None
     try:
-        return json.loads(meta_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+        return json.loads(meta_path.read_bytes())
+    except (OSError, ValueError):
         return None
 
 
@@ -299,47 +563,26 @@ def _week_bounds(value: date) -> tuple[date, date]:
 
 
 def _tier_label(tier: str | None) -> str:
-    if tier == "beginner":
-        return "초보"
-    if tier == "intermediate":
-        return "중수"
-    if tier == "advanced":
-        return "고수"
-    return tier or "-"
+    return TIER_LABELS.get(tier, tier or "-")
 
 
 def _unique_preserve(values: list[str]) -> list[str]:
-    seen: set[str] = set()
-    out: list[str] = []
-    for value in values:
-        if value in seen:
-            continue
-        seen.add(value)
-        out.append(value)
-    return out
+    return list(dict.fromkeys(values))
 
 
 def _run_publish_now(storage_dir: Path) -> tuple[bool, str]:
     try:
-        tz_name = os.getenv("MRC_JOB_TIMEZONE", "Asia/Seoul")
-        tz = ZoneInfo(tz_name)
         seed = os.getenv("MRC_SEED", DEFAULT_SEED)
-        run_publish(storage_dir=storage_dir, tz=tz, seed=seed)
+        run_publish(storage_dir=storage_dir, tz=_job_tz(), seed=seed)
         return True, "업데이트 반영 완료"
     except Exception:
         return False, "업데이트 반영 실패"
 
 
 def _status_label(value: str | None) -> str:
-    mapping = {
-        "pending": "대기",
-        "approved": "승인",
-        "rejected": "반려",
-        "all": "전체",
-    }
     if not value:
         return "-"
-    return mapping.get(value.lower(), value)
+    return STATUS_LABELS.get(value.lower(), value)
 
 
 def _reject_reason(item: dict[str, Any]) -> str:
@@ -356,36 +599,24 @@ def _reject_reason(item: dict[str, Any]) -> str:
 
 
 def _card_status_label(value: str | None) -> str:
-    mapping = {
-        "passed": "통과",
-        "failed": "실패",
-        "needs_review": "확인 필요",
-    }
     if not value:
         return "-"
-    return mapping.get(value, value)
+    return CARD_STATUS_LABELS.get(value, value)
 
 
 def _card_review_label(value: str | None) -> str:
-    mapping = {
-        "approved": "승인",
-        "rejected": "반려",
-        "pending": "대기",
-    }
     if not value:
         return "-"
-    return mapping.get(value, value)
+    return CARD_REVIEW_LABELS.get(value, value)
 
 
-def _format_created_at(value: str | None) -> str:
+def _format_created_at(value: str | None, tz: ZoneInfo | None = None) -> str:
     if not value:
         return "-"
     try:
         dt = datetime.fromisoformat(value)
-        tz_name = os.getenv("MRC_JOB_TIMEZONE", "Asia/Seoul")
-        tz = ZoneInfo(tz_name)
         if dt.tzinfo:
-            dt = dt.astimezone(tz)
+            dt = dt.astimezone(tz or _job_tz())
         return dt.replace(microsecond=0).isoformat(sep=" ")
     except ValueError:
         text = value.replace("T", " ")
@@ -401,7 +632,7 @@ def _format_run_date(value: str | None) -> str:
         run_date = date.fromisoformat(value)
     except ValueError:
         return value
-    weekday = "월화수목금토일"[run_date.weekday()]
+    weekday = WEEKDAY_LABELS[run_date.weekday()]
     return f"{run_date.isoformat()} ({weekday})"
 
 
@@ -412,10 +643,8 @@ def _effective_run_day(run_date: date | None, created_at: str) -> str:
         dt = datetime.fromisoformat(created_at)
     except ValueError:
         return ""
-    tz_name = os.getenv("MRC_JOB_TIMEZONE", "Asia/Seoul")
-    tz = ZoneInfo(tz_name)
     if dt.tzinfo:
-        dt = dt.astimezone(tz)
+        dt = dt.astimezone(_job_tz())
     return dt.date().isoformat()
 
 
@@ -436,6 +665,8 @@ def _build_admin_query(
     run_date: str | None = None,
     runner: str | None = None,
     msg: str | None = None,
+    before: str | None = None,
+    page_size: int | None = None,
 ) -> str:
     params: dict[str, str] = {"status": status}
     if run_date:
@@ -444,103 +675,128 @@ def _build_admin_query(
         params["runner"] = runner
     if msg:
         params["msg"] = msg
+    if before:
+        params["before"] = before
+    if page_size and page_size != ADMIN_PAGE_SIZE:
+        params["page_size"] = str(page_size)
     return urlencode(params)
 
 
+def _admin_paging(request: Request) -> tuple[str | None, int]:
+    before = (request.query_params.get("before") or "").strip() or None
+    page_size = _parse_int(request.query_params.get("page_size")) or ADMIN_PAGE_SIZE
+    return before, min(max(page_size, 1), ADMIN_PAGE_SIZE_MAX)
+
+
 def _build_filter_options(items: list[dict]) -> tuple[list[tuple[str, int]], list[tuple[str, int]]]:
-    date_counts: dict[str, int] = {}
-    runner_counts: dict[str, int] = {}
-    for item in items:
-        run_date = item.get("run_date")
-        if run_date:
-            date_counts[run_date] = date_counts.get(run_date, 0) + 1
-        name = item.get("player_name")
-        if name:
-            runner_counts[name] = runner_counts.get(name, 0) + 1
-    date_options = sorted(date_counts.items(), key=lambda x: x[0], reverse=True)
+    date_counts = Counter(run_date for item in items if (run_date := item.get("run_date")))
+    runner_counts = Counter(name for item in items if (name := item.get("player_name")))
+    date_options = sorted(date_counts.items(), reverse=True)
     runner_options = sorted(runner_counts.items(), key=lambda x: (-x[1], x[0]))
     return date_options, runner_options
 
 
 def _build_submission_indexes(items: list[dict]) -> tuple[dict[date, list[str]], dict[str, list[date]]]:
-    by_date: dict[date, list[str]] = {}
-    by_player: dict[str, list[date]] = {}
+    names_by_date: dict[date, dict[str, None]] = {}
+    dates_by_player: dict[str, set[date]] = {}
     for item in items:
         name = item.get("player_name")
+        if not name:
+            continue
         run_date = _parse_iso_date(item.get("run_date"))
-        if not name or not run_date:
+        if not run_date:
             continue
-        by_date.setdefault(run_date, []).append(name)
-        by_player.setdefault(name, []).append(run_date)
-    for key, names in list(by_date.items()):
-        by_date[key] = _unique_preserve(names)
-    for key, dates in list(by_player.items()):
-        by_player[key] = sorted(set(dates))
+        names_by_date.setdefault(run_date, {})[name] = None
+        dates_by_player.setdefault(name, set()).add(run_date)
+    by_date = {key: list(names) for key, names in names_by_date.items()}
+    by_player = {key: sorted(dates) for key, dates in dates_by_player.items()}
     return by_date, by_player
 
 
+InsightHandler = Callable[..., str]
+
+
+def _distance_insight(beginner: float, intermediate: float, advanced: float) -> InsightHandler:
+    def handler(code: str, item: dict, *, tier: str, **_: Any) -> str:
+        distance_km = item.get("distance_km")
+        threshold = tier_value(tier, beginner, intermediate, advanced)
+        value = f"{distance_km}km" if distance_km is not None else "거리 입력 필요"
+        return f"{code} 기준: {_tier_label(tier)} {threshold}km, 제출 {value}"
+
+    return handler
+
+
+def _duration_insight(beginner: float, intermediate: float, advanced: float) -> InsightHandler:
+    def handler(code: str, item: dict, *, tier: str, **_: Any) -> str:
+        duration_min = item.get("duration_min")
+        threshold = tier_value(tier, beginner, intermediate, advanced)
+        value = f"{duration_min}분" if duration_min is not None else "시간 입력 필요"
+        return f"{code} 기준: {_tier_label(tier)} {threshold}분, 제출 {value}"
+
+    return handler
+
+
+def _start_time_insight(code: str, item: dict, **_: Any) -> str:
+    start_time = item.get("start_time") or "시간 입력 필요"
+    return f"{code} 시작 시간: {start_time}"
+
+
+def _weekday_insight(code: str, item: dict, *, run_date: date | None, **_: Any) -> str:
+    if not run_date:
+        return f"{code} 날짜 입력 필요"
+    return f"{code} 날짜: {run_date.isoformat()} ({WEEKDAY_LABELS[run_date.weekday()]})"
+
+
+def _day_runners_insight(
+    code: str, item: dict, *, run_date: date | None, by_date: dict[date, list[str]], **_: Any
+) -> str:
+    if not run_date:
+        return f"{code} 날짜 입력 필요"
+    names = by_date.get(run_date, [])
+    names_text = ", ".join(names) if names else "-"
+    return f"{code} 당일 인증 {len(names)}명: {names_text}"
+
+
+def _weekly_runs_insight(
+    code: str, item: dict, *, run_date: date | None, by_player: dict[str, list[date]], **_: Any
+) -> str:
+    if not run_date:
+        return f"{code} 날짜 입력 필요"
+    start, end = _week_bounds(run_date)
+    name = item.get("player_name") or "-"
+    dates = [d for d in by_player.get(name, []) if start <= d <= end]
+    dates_text = ", ".join(d.isoformat() for d in dates) if dates else "-"
+    return f"{code} 주간({start.isoformat()}~{end.isoformat()}): {len(dates)}회 ({dates_text})"
+
+
+INSIGHT_HANDLERS: dict[str, InsightHandler] = {
+    "A01": _distance_insight(5.0, 7.0, 10.0),
+    "A02": _distance_insight(6.0, 8.0, 12.0),
+    "A03": _distance_insight(7.0, 10.0, 15.0),
+    "A04": _duration_insight(30.0, 40.0, 50.0),
+    "A05": _duration_insight(50.0, 60.0, 70.0),
+    "B01": _start_time_insight,
+    "B02": _start_time_insight,
+    "B05": _weekday_insight,
+    "C04": _day_runners_insight,
+    "D02": _weekly_runs_insight,
+}
+
+
 def _build_insights(item: dict, *, by_date: dict[date, list[str]], by_player: dict[str, list[date]]) -> str:
     codes = item.get("resolved_codes") or []
     if not codes:
         return "-"
 
     run_date = _parse_iso_date(item.get("run_date"))
-    name = item.get("player_name") or "-"
     tier = item.get("tier") or "-"
-    distance_km = item.get("distance_km")
-    duration_min = item.get("duration_min")
     insights: list[str] = []
-
     for code in codes:
-        if code == "A01":
-            threshold = tier_value(tier, 5.0, 7.0, 10.0)
-            value = f"{distance_km}km" if distance_km is not None else "거리 입력 필요"
-            insights.append(f"A01 기준: {_tier_label(tier)} {threshold}km, 제출 {value}")
-        elif code == "A02":
-            threshold = tier_value(tier, 6.0, 8.0, 12.0)
-            value = f"{distance_km}km" if distance_km is not None else "거리 입력 필요"
-            insights.append(f"A02 기준: {_tier_label(tier)} {threshold}km, 제출 {value}")
-        elif code == "A03":
-            threshold = tier_value(tier, 7.0, 10.0, 15.0)
-            value = f"{distance_km}km" if distance_km is not None else "거리 입력 필요"
-            insights.append(f"A03 기준: {_tier_label(tier)} {threshold}km, 제출 {value}")
-        elif code == "A04":
-            threshold = tier_value(tier, 30.0, 40.0, 50.0)
-            value = f"{duration_min}분" if duration_min is not None else "시간 입력 필요"
-            insights.append(f"A04 기준: {_tier_label(tier)} {threshold}분, 제출 {value}")
-        elif code == "A05":
-            threshold = tier_value(tier, 50.0, 60.0, 70.0)
-            value = f"{duration_min}분" if duration_min is not None else "시간 입력 필요"
-            insights.append(f"A05 기준: {_tier_label(tier)} {threshold}분, 제출 {value}")
-        elif code == "B01":
-            start_time = item.get("start_time") or "시간 입력 필요"
-            insights.append(f"B01 시작 시간: {start_time}")
-        elif code == "B02":
-            start_time = item.get("start_time") or "시간 입력 필요"
-            insights.append(f"B02 시작 시간: {start_time}")
-        elif code == "B05":
-            if run_date:
-                weekday = "월화수목금토일"[run_date.weekday()]
-                insights.append(f"B05 날짜: {run_date.isoformat()} ({weekday})")
-            else:
-                insights.append("B05 날짜 입력 필요")
-        elif code == "C04":
-            if run_date:
-                names = by_date.get(run_date, [])
-                names_text = ", ".join(names) if names else "-"
-                insights.append(f"C04 당일 인증 {len(names)}명: {names_text}")
-            else:
-                insights.append("C04 날짜 입력 필요")
-        elif code == "D02":
-            if run_date:
-                start, end = _week_bounds(run_date)
-                dates = [d for d in by_player.get(name, []) if start <= d <= end]
-                dates_text = ", ".join(d.isoformat() for d in dates) if dates else "-"
-                insights.append(
-                    f"D02 주간({start.isoformat()}~{end.isoformat()}): {len(dates)}회 ({dates_text})"
-                )
-            else:
-                insights.append("D02 날짜 입력 필요")
+        handler = INSIGHT_HANDLERS.get(code)
+        if handler:
+            insights.append(
+                handler(code, item, tier=tier, run_date=run_date, by_date=by_date, by_player=by_player)
+            )
 
     if not insights:
         return "-"
@@ -548,37 +804,22 @@ def _build_insights(item: dict, *, by_date: dict[date, list[str]], by_player: di
     return f"<ul class=\"insights\">{items_html}</ul>"
 
 
-def _render_admin_page(
-    *,
-    items: list[dict],
-    index_items: list[dict],
+REVIEW_FORM_OPEN = '\n<form method="post" action="/admin/review/'
+REVIEW_FORM_BUTTONS = (
+    '<button type="submit" name="review_status" value="approved">승인</button>\n'
+    '<button type="submit" name="review_status" value="rejected">반려</button>\n'
+    "</form>\n"
+)
+
+
+@lru_cache(maxsize=32)
+def _render_filter_blocks(
     status: str,
-    message: str,
-    boards_meta: str,
-    card_titles: dict[str, str],
     run_date_filter: str | None,
     runner_filter: str | None,
-    admin_key: str,
-) -> str:
-    by_date, by_player = _build_submission_indexes(index_items)
-    date_options, runner_options = _build_filter_options(index_items)
-    submitters = _unique_preserve([item.get("player_name") for item in items if item.get("player_name")])
-    if submitters:
-        submitters_html = f"{len(submitters)}명 · " + ", ".join(html.escape(name) for name in submitters)
-    else:
-        submitters_html = "-"
-    filter_query = _build_admin_query(
-        status=status,
-        run_date=run_date_filter,
-        runner=runner_filter,
-    )
-    filter_summary_parts = []
-    if runner_filter:
-        filter_summary_parts.append(f"러너: {html.escape(runner_filter)}")
-    if run_date_filter:
-        filter_summary_parts.append(f"날짜: {_format_run_date(run_date_filter)}")
-    filter_summary = " · ".join(filter_summary_parts) if filter_summary_parts else "없음"
-
+    date_options: tuple[tuple[str, int], ...],
+    runner_options: tuple[tuple[str, int], ...],
+) -> tuple[str, str, str, str]:
     runner_select_options = ['<option value="">전체</option>']
     for name, count in runner_options:
         selected = " selected" if runner_filter == name else ""
@@ -613,181 +854,141 @@ def _render_admin_page(
             f"<a class=\"filter-chip{active}\" href=\"/admin?{link_query}#submissions\">{html.escape(name)} ({count})</a>"
         )
     runner_links_html = " ".join(runner_links) if runner_links else "-"
-    rows = []
-    for item in items:
-        created = _format_created_at(item.get("created_at"))
-        name = item.get("player_name") or "-"
-        tier = _tier_label(item.get("tier"))
-        run_date = _format_run_date(item.get("run_date"))
-        summary = _validation_summary(item.get("validation") or {})
-        review_notes = item.get("review_notes") or ""
-        review_cards = item.get("review_cards") or {}
-        submission_status = item.get("review_status") or "pending"
-        reject_reason = _reject_reason(item)
-        cards_html = _format_card_list(
-            item.get("validation") or {},
-            card_titles,
-            fallback_codes=item.get("resolved_codes") or [],
-            review_cards=review_cards,
-        )
-        files = item.get("files") or []
-        file_count = len(files)
-        if file_count:
-            file_link = f"/admin/submissions/{item['id']}"
-            files_html = f"<a class=\"btn-link\" href=\"{file_link}\">사진 보기 ({file_count})</a>"
-        else:
-            files_html = "-"
-        insights_html = _build_insights(item, by_date=by_date, by_player=by_player)
-        action_parts = []
-        validation_cards = (item.get("validation") or {}).get("cards") if isinstance(item.get("validation"), dict) else None
-        if validation_cards:
-            for card in validation_cards:
-                code = card.get("resolved_code") or card.get("label") or "-"
-                label = card.get("label") or code
-                status = review_cards.get(code) or review_cards.get(label)
-                if not status:
-                    if not review_cards and submission_status in ("approved", "rejected"):
-                        status = submission_status
-                    else:
-                        status = "pending"
-                status_label = _card_review_label(status)
-                status_html = (
-                    f'<span class="card-status card-status--review-{html.escape(status)}">{html.escape(status_label)}</span>'
-                )
-                if status == "pending":
-                    form_html = f"""
-                      <form method="post" action="/admin/review/{item['id']}?{filter_query}">
-                        <input type="hidden" name="admin_key" value="{html.escape(admin_key)}" />
-                        <input type="hidden" name="card_code" value="{html.escape(code)}" />
-                        <button type="submit" name="review_status" value="approved">승인</button>
-                        <button type="submit" name="review_status" value="rejected">반려</button>
-                      </form>
-                    """
-                else:
-                    form_html = ""
-                action_parts.append(
-                    f'<div><span class="card-code">{html.escape(label)}</span> {status_html}{form_html}</div>'
-                )
-        else:
-            for code in item.get("resolved_codes") or []:
-                status = review_cards.get(code)
-                if not status:
-                    if not review_cards and submission_status in ("approved", "rejected"):
-                        status = submission_status
-                    else:
-                        status = "pending"
-                status_label = _card_review_label(status)
-                status_html = (
-                    f'<span class="card-status card-status--review-{html.escape(status)}">{html.escape(status_label)}</span>'
-                )
-                if status == "pending":
-                    form_html = f"""
-                      <form method="post" action="/admin/review/{item['id']}?{filter_query}">
-                        <input type="hidden" name="admin_key" value="{html.escape(admin_key)}" />
-                        <input type="hidden" name="card_code" value="{html.escape(code)}" />
-                        <button type="submit" name="review_status" value="approved">승인</button>
-                        <button type="submit" name="review_status" value="rejected">반려</button>
-                      </form>
-                    """
-                else:
-                    form_html = ""
-                action_parts.append(
-                    f'<div><span class="card-code">{html.escape(code)}</span> {status_html}{form_html}</div>'
-                )
-        if not action_parts and submission_status == "pending":
-            action_parts.append(
-                f"""
-                <form method="post" action="/admin/review/{item['id']}?{filter_query}">
-                  <input type="hidden" name="admin_key" value="{html.escape(admin_key)}" />
-                  <button type="submit" name="review_status" value="approved">승인</button>
-                  <button type="submit" name="review_status" value="rejected">반려</button>
-                </form>
-                """
-            )
-        if reject_reason:
-            action_parts.insert(0, f'<div class="review-badge review-badge--rejected">{html.escape(reject_reason)}</div>')
-        action_html = "\n".join(action_parts) if action_parts else "-"
-        row = f"""
-          <tr>
-            <td>{created}</td>
-            <td>{name}</td>
-            <td>{tier}</td>
-            <td>{run_date}</td>
-            <td>{cards_html}</td>
-            <td>{summary}</td>
-            <td>{insights_html}</td>
-            <td>{files_html}</td>
-            <td>{action_html}</td>
-          </tr>
-        """
-        rows.append(row)
+    return runner_select_html, date_select_html, date_links_html, runner_links_html
 
-    pending_query = _build_admin_query(status="pending", run_date=run_date_filter, runner=runner_filter)
-    approved_query = _build_admin_query(status="approved", run_date=run_date_filter, runner=runner_filter)
-    rejected_query = _build_admin_query(status="rejected", run_date=run_date_filter, runner=runner_filter)
-    all_query = _build_admin_query(status="all", run_date=run_date_filter, runner=runner_filter)
 
-    status_label = f"{_status_label(status)} · {len(items)}건"
-    table_rows = "\n".join(rows) if rows else "<tr><td colspan='9'>제출 내역 없음</td></tr>"
-    return f"""
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+STATIC_CACHE_CONTROL = "public, max-age=86400, immutable"
+
+
+def _static_href(name: str) -> str:
+    # The content hash in the query string lets browsers cache the file as immutable across deploys.
+    digest = hashlib.sha1((STATIC_DIR / name).read_bytes()).hexdigest()[:10]
+    return f"/static/{name}?v={digest}"
+
+
+ADMIN_CSS_HREF = _static_href("admin.css")
+ADMIN_DETAIL_CSS_HREF = _static_href("admin-detail.css")
+ADMIN_LOGIN_CSS_HREF = _static_href("admin-login.css")
+
+
+class _CachedStaticFiles(StaticFiles):
+    def file_response(self, *args: Any, **kwargs: Any) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = STATIC_CACHE_CONTROL
+        return response
+
+
+ADMIN_PAGE_SIZE = 50
+ADMIN_PAGE_SIZE_MAX = 500
+
+
+# Static document head for the admin page, encoded once at import; only the body is encoded per render.
+ADMIN_PAGE_HEAD = f"""
 <!doctype html>
 <html lang="ko">
 <head>
   <meta charset="utf-8" />
   <meta name="viewport" content="width=device-width, initial-scale=1" />
   <title>운영진</title>
-  <style>
-    body {{ font-family: Arial, sans-serif; margin: 24px; color: #111827; }}
-    table {{ border-collapse: collapse; width: 100%; }}
-    th, td {{ border: 1px solid #ddd; padding: 8px; font-size: 12px; vertical-align: top; }}
-    th {{ background: #f4f4f4; text-align: left; }}
-    .meta {{ display: grid; gap: 6px; margin-top: 6px; color: #374151; }}
-    .message {{ color: #0a6; }}
-    .hint {{ margin: 6px 0 0; font-size: 12px; color: #6b7280; }}
-    .notice {{ margin-top: 8px; font-size: 12px; color: #b91c1c; }}
-    .card-list {{ margin: 0; padding-left: 16px; }}
-    .card-list li {{ margin-bottom: 4px; }}
-    .card-code {{ font-weight: 700; }}
-    .card-title {{ color: #374151; }}
-    .card-status {{ font-size: 11px; padding: 1px 6px; border-radius: 999px; background: #eef2ff; margin-left: 4px; }}
-    .card-status--failed {{ background: #fee2e2; }}
-    .card-status--needs_review {{ background: #fef3c7; }}
-    .card-status--passed {{ background: #dcfce7; }}
-    .card-status--review-approved {{ background: #dcfce7; }}
-    .card-status--review-rejected {{ background: #fee2e2; }}
-    .card-status--review-pending {{ background: #fef3c7; }}
-    .review-badge {{ display: inline-flex; align-items: center; gap: 6px; padding: 2px 8px; border-radius: 999px; font-size: 11px; font-weight: 600; }}
-    .review-badge--rejected {{ background: #fee2e2; color: #991b1b; }}
-    .btn-link {{ display: inline-block; padding: 6px 10px; border: 1px solid #d1d5db; border-radius: 8px; text-decoration: none; color: #111827; background: #ffffff; }}
-    .insights {{ margin: 0; padding-left: 16px; color: #374151; }}
-    .insights li {{ margin-bottom: 4px; }}
-    .nav-bar {{ display: flex; gap: 8px; flex-wrap: wrap; margin: 18px 0; }}
-    .section-title {{ margin: 0; }}
-    .page-header {{ display: flex; gap: 18px; align-items: flex-start; justify-content: space-between; flex-wrap: wrap; }}
-    .header-actions {{ min-width: 260px; padding: 12px; border: 1px solid #e5e7eb; border-radius: 12px; background: #f9fafb; }}
-    .header-actions form {{ display: grid; gap: 8px; }}
-    .section-row {{ display: flex; align-items: center; justify-content: space-between; gap: 12px; margin: 12px 0; flex-wrap: wrap; }}
-    .action-form button {{ padding: 8px 12px; border-radius: 8px; border: 1px solid #111827; background: #111827; color: #ffffff; }}
-    .filter-panel {{ margin: 12px 0; padding: 12px; border: 1px solid #e5e7eb; border-radius: 12px; background: #f9fafb; }}
-    .filter-form {{ display: flex; flex-wrap: wrap; gap: 8px; align-items: end; }}
-    .filter-form label {{ display: flex; flex-direction: column; gap: 4px; font-size: 12px; color: #374151; }}
-    .filter-form select {{ min-width: 160px; padding: 6px 8px; border: 1px solid #d1d5db; border-radius: 6px; }}
-    .filter-meta {{ font-size: 12px; color: #6b7280; margin-bottom: 8px; }}
-    .filter-lists {{ display: grid; gap: 6px; margin-top: 8px; font-size: 12px; color: #374151; }}
-    .filter-list {{ display: flex; flex-wrap: wrap; gap: 6px; align-items: center; }}
-    .filter-label {{ font-weight: 600; margin-right: 4px; }}
-    .filter-chip {{ display: inline-block; padding: 4px 8px; border-radius: 999px; border: 1px solid #d1d5db; text-decoration: none; color: #111827; background: #ffffff; }}
-    .filter-chip.is-active {{ border-color: #111827; background: #111827; color: #ffffff; }}
-  </style>
+  <link rel="stylesheet" href="{ADMIN_CSS_HREF}" />
 </head>
-<body>
+""".encode("utf-8")
+
+
+ADMIN_PAGE_FOOT = """
+  </section>
+</body>
+</html>
+""".encode("utf-8")
+
+
+def _iter_admin_page(
+    *,
+    items: list[dict],
+    index_items: list[dict],
+    status: str,
+    message: str,
+    boards_meta: str,
+    card_titles: dict[str, str],
+    run_date_filter: str | None,
+    runner_filter: str | None,
+    admin_key: str,
+    status_counts: dict[str, int],
+    before: str | None,
+    next_cursor: str | None,
+    page_size: int,
+) -> Iterator[bytes]:
+    by_date, by_player = _build_submission_indexes(index_items)
+    date_options, runner_options = _build_filter_options(index_items)
+    submitters = _unique_preserve([item.get("player_name") for item in items if item.get("player_name")])
+    if submitters:
+        submitters_html = f"{len(submitters)}명 · " + ", ".join(html.escape(name) for name in submitters)
+    else:
+        submitters_html = "-"
+    filter_query = _build_admin_query(
+        status=status,
+        run_date=run_date_filter,
+        runner=runner_filter,
+        before=before,
+        page_size=page_size,
+    )
+    filter_summary_parts = []
+    if runner_filter:
+        filter_summary_parts.append(f"러너: {html.escape(runner_filter)}")
+    if run_date_filter:
+        filter_summary_parts.append(f"날짜: {_format_run_date(run_date_filter)}")
+    filter_summary = " · ".join(filter_summary_parts) if filter_summary_parts else "없음"
+
+    runner_select_html, date_select_html, date_links_html, runner_links_html = _render_filter_blocks(
+        status, run_date_filter, runner_filter, tuple(date_options), tuple(runner_options)
+    )
+    escaped_key = html.escape(admin_key)
+    review_form_fields = f'?{filter_query}">\n<input type="hidden" name="admin_key" value="{escaped_key}" />\n'
+    tz = _job_tz()
+    pending_query = _build_admin_query(status="pending", run_date=run_date_filter, runner=runner_filter)
+    approved_query = _build_admin_query(status="approved", run_date=run_date_filter, runner=runner_filter)
+    rejected_query = _build_admin_query(status="rejected", run_date=run_date_filter, runner=runner_filter)
+    all_query = _build_admin_query(status="all", run_date=run_date_filter, runner=runner_filter)
+
+    pending_count = status_counts.get("pending", 0)
+    approved_count = status_counts.get("approved", 0)
+    rejected_count = status_counts.get("rejected", 0)
+    all_count = sum(status_counts.values())
+
+    pager_links = []
+    if before:
+        first_query = _build_admin_query(
+            status=status, run_date=run_date_filter, runner=runner_filter, page_size=page_size
+        )
+        pager_links.append(f'<a class="btn-link" href="/admin?{first_query}#submissions">처음</a>')
+    if next_cursor:
+        next_query = _build_admin_query(
+            status=status,
+            run_date=run_date_filter,
+            runner=runner_filter,
+            before=next_cursor,
+            page_size=page_size,
+        )
+        pager_links.append(f'<a class="btn-link" href="/admin?{next_query}#submissions">다음</a>')
+    pager_html = f'\n    <div class="pager">{" ".join(pager_links)}</div>' if pager_links else ""
+
+    escaped_status = html.escape(status)
+    # status_counts ignores the runner/date filters, so a filtered list can only report what this page holds.
+    if runner_filter or run_date_filter:
+        count_label = f"이 페이지 {len(items)}건"
+    else:
+        count_label = f"{all_count if status == 'all' else status_counts.get(status, 0)}건"
+    status_label = f"{html.escape(_status_label(status))} · {count_label}"
+    reset_query = _build_admin_query(status=status)
+    page_top = f"""<body>
   <header class="page-header" id="boards">
     <div>
       <h1>운영진 관리</h1>
       <div class="meta">
         <div>빙고판: {boards_meta}</div>
         <div>제출자(현재 목록): {submitters_html}</div>
-        <div class="message">{message}</div>
+        <div class="message">{html.escape(message)}</div>
         <div class="notice">자동 판정은 참고용입니다. 최종 확정은 운영진 확인 후 반영됩니다.</div>
       </div>
     </div>
@@ -795,7 +996,7 @@ def _render_admin_page(
       <h2 class="section-title">빙고판 업로드</h2>
       <p class="hint">설문 응답(.xlsx)을 업로드하면 보드가 갱신됩니다.</p>
       <form method="post" action="/admin/boards/upload" enctype="multipart/form-data">
-        <input type="hidden" name="admin_key" value="{html.escape(admin_key)}" />
+        <input type="hidden" name="admin_key" value="{escaped_key}" />
         <input type="file" name="file" accept=".xlsx" required />
         <button type="submit">업로드</button>
       </form>
@@ -803,10 +1004,10 @@ def _render_admin_page(
   </header>
 
   <nav class="nav-bar">
-    <a class="btn-link" href="/admin?{pending_query}#submissions">대기</a>
-    <a class="btn-link" href="/admin?{approved_query}#submissions">승인</a>
-    <a class="btn-link" href="/admin?{rejected_query}#submissions">반려</a>
-    <a class="btn-link" href="/admin?{all_query}#submissions">전체</a>
+    <a class="btn-link" href="/admin?{pending_query}#submissions">대기 ({pending_count})</a>
+    <a class="btn-link" href="/admin?{approved_query}#submissions">승인 ({approved_count})</a>
+    <a class="btn-link" href="/admin?{rejected_query}#submissions">반려 ({rejected_count})</a>
+    <a class="btn-link" href="/admin?{all_query}#submissions">전체 ({all_count})</a>
   </nav>
 
   <section id="submissions">
@@ -816,14 +1017,14 @@ def _render_admin_page(
         <p class="hint">자동 판정 결과와 검토 메모를 확인하세요.</p>
       </div>
       <form method="post" action="/admin/publish?{filter_query}" class="action-form">
-        <input type="hidden" name="admin_key" value="{html.escape(admin_key)}" />
+        <input type="hidden" name="admin_key" value="{escaped_key}" />
         <button type="submit">업데이트 반영</button>
       </form>
     </div>
     <div class="filter-panel">
       <div class="filter-meta">현재 필터: {filter_summary}</div>
       <form method="get" action="/admin" class="filter-form">
-        <input type="hidden" name="status" value="{html.escape(status)}" />
+        <input type="hidden" name="status" value="{escaped_status}" />
         <label>
           러너
           <select name="runner">
@@ -837,7 +1038,7 @@ def _render_admin_page(
           </select>
         </label>
         <button type="submit">필터 적용</button>
-        <a class="btn-link" href="/admin?{_build_admin_query(status=status)}#submissions">초기화</a>
+        <a class="btn-link" href="/admin?{reset_query}#submissions">초기화</a>
       </form>
       <div class="filter-lists">
         <div class="filter-list">
@@ -865,12 +1066,103 @@ def _render_admin_page(
         </tr>
       </thead>
       <tbody>
-        {table_rows}
+"""
+    yield ADMIN_PAGE_HEAD
+    yield page_top.encode("utf-8")
+    if not items:
+        yield "<tr><td colspan='9'>제출 내역 없음</td></tr>".encode("utf-8")
+    for item in items:
+        item_id = item["id"]
+        review_cards = item.get("review_cards") or {}
+        submission_status = item.get("review_status") or "pending"
+        reject_reason = _reject_reason(item)
+        validation = item.get("validation") or {}
+        cards_html = _format_card_list(
+            validation,
+            card_titles,
+            fallback_codes=item.get("resolved_codes") or [],
+            review_cards=review_cards,
+        )
+        files = item.get("files") or []
+        file_count = len(files)
+        if file_count:
+            files_html = f"<a class=\"btn-link\" href=\"/admin/submissions/{item_id}\">사진 보기 ({file_count})</a>"
+        else:
+            files_html = "-"
+        insights_html = _build_insights(item, by_date=by_date, by_player=by_player)
+
+        validation_cards = validation.get("cards") if isinstance(validation, dict) else None
+        if validation_cards:
+            card_entries = []
+            for card in validation_cards:
+                code = card.get("resolved_code") or card.get("label") or "-"
+                card_entries.append((code, card.get("label") or code))
+        else:
+            card_entries = [(code, code) for code in item.get("resolved_codes") or []]
+        review_form_head = f"{REVIEW_FORM_OPEN}{item_id}{review_form_fields}"
+        action_parts = []
+        for code, label in card_entries:
+            card_status = review_cards.get(code) or review_cards.get(label)
+            if not card_status:
+                if not review_cards and submission_status in ("approved", "rejected"):
+                    card_status = submission_status
+                else:
+                    card_status = "pending"
+            status_html = _review_status_span(card_status)
+            escaped_label = html.escape(label)
+            if card_status == "pending":
+                escaped_code = escaped_label if code == label else html.escape(code)
+                form_html = (
+                    f'{review_form_head}<input type="hidden" name="card_code" value="{escaped_code}" />\n'
+                    f"{REVIEW_FORM_BUTTONS}"
+                )
+            else:
+                form_html = ""
+            action_parts.append(f'<div><span class="card-code">{escaped_label}</span> {status_html}{form_html}</div>')
+        if not action_parts and submission_status == "pending":
+            action_parts.append(review_form_head + REVIEW_FORM_BUTTONS)
+        if reject_reason:
+            action_parts.insert(0, _reject_badge(reject_reason))
+        action_html = "\n".join(action_parts) if action_parts else "-"
+        row = f"""
+          <tr>
+            <td>{_format_created_at(item.get("created_at"), tz)}</td>
+            <td>{html.escape(item.get("player_name") or "-")}</td>
+            <td>{_tier_label(item.get("tier"))}</td>
+            <td>{_format_run_date(item.get("run_date"))}</td>
+            <td>{cards_html}</td>
+            <td>{_validation_summary(validation)}</td>
+            <td>{insights_html}</td>
+            <td>{files_html}</td>
+            <td>{action_html}</td>
+          </tr>
+        """
+        yield row.encode("utf-8")
+
+    yield f"""
       </tbody>
-    </table>
-  </section>
-</body>
-</html>
+    </table>{pager_html}""".encode("utf-8")
+    yield ADMIN_PAGE_FOOT
+
+
+ADMIN_DETAIL_PREAMBLE = f"""  <link rel="stylesheet" href="{ADMIN_DETAIL_CSS_HREF}" />
+</head>
+<body>
+  <div class="nav-bar">
+    <a class="btn-link" href="/admin?status=pending#submissions">대기</a>
+    <a class="btn-link" href="/admin?status=approved#submissions">승인</a>
+    <a class="btn-link" href="/admin?status=rejected#submissions">반려</a>
+    <a class="btn-link" href="/admin?status=all#submissions">전체</a>
+    <a class="btn-link" href="/admin?status=pending#boards">빙고판 업로드</a>
+  </div>
+  <h1>제출 상세</h1>
+"""
+
+ADMIN_LOGIN_PREAMBLE = f"""  <link rel="stylesheet" href="{ADMIN_LOGIN_CSS_HREF}" />
+</head>
+<body>
+  <h1>운영진 인증</h1>
+  <p>운영진 키를 입력하세요.</p>
 """
 
 
@@ -891,11 +1183,7 @@ def _render_admin_submission_page(
     distance_text = f"{distance}km" if distance is not None else "-"
     duration_text = f"{duration}분" if duration is not None else "-"
     reject_reason = _reject_reason(meta)
-    reject_html = (
-        f'<div class="review-badge review-badge--rejected">{html.escape(reject_reason)}</div>'
-        if reject_reason
-        else ""
-    )
+    reject_html = _reject_badge(reject_reason) if reject_reason else ""
     cards_html = _format_card_list(
         meta.get("validation") or [],
         card_titles,
@@ -907,7 +1195,7 @@ def _render_admin_submission_page(
         filename = info.get("filename") or info.get("stored_as") or f"file-{idx + 1}"
         file_url = f"/admin/submissions/{submission_id}/files/{idx}"
         escaped = html.escape(filename)
-        if Path(filename).suffix.lower() in (".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp"):
+        if Path(filename).suffix.lower() in IMAGE_SUFFIXES:
             file_items.append(
                 f"""
                 <figure class="file-item">
@@ -930,39 +1218,7 @@ def _render_admin_submission_page(
   <meta charset="utf-8" />
   <meta name="viewport" content="width=device-width, initial-scale=1" />
   <title>운영진 · {html.escape(submission_id)}</title>
-  <style>
-    body {{ font-family: Arial, sans-serif; margin: 24px; color: #111827; }}
-    a {{ color: inherit; }}
-    .meta {{ margin-bottom: 16px; }}
-    .chips {{ display: flex; gap: 8px; flex-wrap: wrap; margin: 8px 0 16px; }}
-    .chip {{ padding: 4px 8px; border-radius: 999px; background: #f3f4f6; font-size: 12px; }}
-    .card-list {{ margin: 0; padding-left: 16px; }}
-    .card-list li {{ margin-bottom: 4px; }}
-    .card-code {{ font-weight: 700; }}
-    .card-title {{ color: #374151; }}
-    .card-status {{ font-size: 11px; padding: 1px 6px; border-radius: 999px; background: #eef2ff; margin-left: 4px; }}
-    .card-status--failed {{ background: #fee2e2; }}
-    .card-status--needs_review {{ background: #fef3c7; }}
-    .card-status--passed {{ background: #dcfce7; }}
-    .review-badge {{ display: inline-flex; align-items: center; gap: 6px; padding: 2px 8px; border-radius: 999px; font-size: 11px; font-weight: 600; }}
-    .review-badge--rejected {{ background: #fee2e2; color: #991b1b; }}
-    .files {{ display: grid; gap: 12px; grid-template-columns: repeat(auto-fit, minmax(220px, 1fr)); }}
-    .file-item {{ border: 1px solid #e5e7eb; border-radius: 10px; padding: 8px; background: #f9fafb; }}
-    .file-item img {{ width: 100%; border-radius: 8px; margin-top: 6px; }}
-    .nav-bar {{ display: flex; gap: 8px; flex-wrap: wrap; margin: 0 0 16px; }}
-    .btn-link {{ display: inline-block; padding: 4px 8px; border: 1px solid #d1d5db; border-radius: 6px; text-decoration: none; color: #111827; background: #ffffff; }}
-  </style>
-</head>
-<body>
-  <div class="nav-bar">
-    <a class="btn-link" href="/admin?status=pending#submissions">대기</a>
-    <a class="btn-link" href="/admin?status=approved#submissions">승인</a>
-    <a class="btn-link" href="/admin?status=rejected#submissions">반려</a>
-    <a class="btn-link" href="/admin?status=all#submissions">전체</a>
-    <a class="btn-link" href="/admin?status=pending#boards">빙고판 업로드</a>
-  </div>
-  <h1>제출 상세</h1>
-  <div class="meta">
+{ADMIN_DETAIL_PREAMBLE}  <div class="meta">
     <div><strong>이름</strong>: {html.escape(str(name))}</div>
     <div><strong>제출 시간</strong>: {html.escape(str(created))}</div>
     {reject_html}
@@ -994,18 +1250,7 @@ def _render_admin_login(path: str, message: str | None = None) -> str:
   <meta charset="utf-8" />
   <meta name="viewport" content="width=device-width, initial-scale=1" />
   <title>운영진 로그인</title>
-  <style>
-    body {{ font-family: Arial, sans-serif; margin: 24px; color: #111827; }}
-    form {{ display: flex; gap: 8px; align-items: center; }}
-    input {{ padding: 8px 10px; border-radius: 8px; border: 1px solid #d1d5db; }}
-    button {{ padding: 8px 12px; border-radius: 8px; border: 1px solid #111827; background: #111827; color: #fff; }}
-    .message {{ color: #b91c1c; margin-top: 12px; }}
-  </style>
-</head>
-<body>
-  <h1>운영진 인증</h1>
-  <p>운영진 키를 입력하세요.</p>
-  <form method="post" action="/admin/login">
+{ADMIN_LOGIN_PREAMBLE}  <form method="post" action="/admin/login">
     <input type="password" name="admin_key" placeholder="운영진 키" required />
     <input type="hidden" name="next" value="{html.escape(path)}" />
     <button type="submit">입장</button>
@@ -1016,6 +1261,15 @@ def _render_admin_login(path: str, message: str | None = None) -> str:
 """
 
 
+def _warm_caches(storage_dir: Path, base_dir: Path) -> None:
+    seed = (os.getenv("MRC_SEED", DEFAULT_SEED) or DEFAULT_SEED).strip() or DEFAULT_SEED
+    map_labels = (os.getenv("MRC_BOARD_LABEL_MAP") or "").strip().lower() in ENV_FLAG_VALUES
+    carddeck_path = Path(os.getenv("MRC_CARDDECK_PATH", str(base_dir / "CardDeck.md")))
+    _cached_cards_body(seed)
+    _load_card_titles(carddeck_path)
+    _load_board_codes(storage_dir, carddeck_path=carddeck_path, seed=seed, map_labels=map_labels)
+
+
 def create_app() -> FastAPI:
     base_dir = Path(__file__).resolve().parents[1]
     load_dotenv(base_dir / ".env")
@@ -1023,14 +1277,16 @@ def create_app() -> FastAPI:
 
     storage = Storage(settings.storage_dir)
     storage.init()
+    _warm_caches(settings.storage_dir, base_dir)
 
     app = FastAPI(title="MRC Bingo Submit API", version="0.1.0")
     app.state.settings = settings
     app.state.storage = storage
     app.state.base_dir = base_dir
+    app.mount("/static", _CachedStaticFiles(directory=STATIC_DIR), name="static")
 
     app.add_middleware(
-        CORSMiddleware,
+        _ApiCORSMiddleware,
         allow_origins=settings.allowed_origins,
         allow_credentials=False,
         allow_methods=["GET", "POST", "OPTIONS"],
@@ -1038,66 +1294,48 @@ def create_app() -> FastAPI:
     )
 
     @app.get("/healthz")
-    def healthz() -> dict[str, str]:
-        return {"status": "ok"}
+    def healthz() -> Response:
+        return Response(content=HEALTHZ_BODY, media_type="application/json")
 
     @app.get("/api/v1/cards")
-    def cards(seed: str | None = None) -> dict[str, Any]:
+    def cards(seed: str | None = None) -> Response:
         resolved_seed = (seed or os.getenv("MRC_SEED", DEFAULT_SEED)).strip() or DEFAULT_SEED
-        label_map = build_label_map(resolved_seed)
-        return {
-            "seed": resolved_seed,
-            "cards": [
-                {
-                    "code": c.code,
-                    "type": c.card_type,
-                    "stars": c.stars,
-                    "name": c.name,
-                    "label": label_map.by_id.get(c.code),
-                }
-                for c in CARDS.values()
-            ],
-            "by_type": CARDS_BY_TYPE,
-            "label_map": label_map.by_id,
-        }
+        return Response(content=_cached_cards_body(resolved_seed), media_type="application/json")
 
     @app.get("/api/v1/progress")
-    def progress() -> JSONResponse:
+    def progress() -> Response:
         path = settings.storage_dir / "publish" / "progress.json"
-        if not path.exists():
-            raise HTTPException(status_code=404, detail="progress not found")
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
+            body = _cached_json_body(str(path), path.stat().st_mtime_ns)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="progress not found")
+        except ValueError:
             raise HTTPException(status_code=500, detail="progress invalid")
-        return JSONResponse(content=data)
+        return Response(content=body, media_type="application/json")
 
     @app.get("/api/v1/seal-status")
     def seal_status(player_name: str) -> JSONResponse:
         name = (player_name or "").strip()
         if not name:
             raise HTTPException(status_code=400, detail="player_name required")
-        tz_name = os.getenv("MRC_JOB_TIMEZONE", "Asia/Seoul")
-        seals = storage.get_active_seals(player_name=name, tz=ZoneInfo(tz_name))
+        seals = storage.get_active_seals(player_name=name, tz=_job_tz())
         if not seals:
             return JSONResponse(content={"active": False, "seals": []})
         return JSONResponse(content={"active": True, "seals": seals})
 
     @app.get("/api/v1/boards")
-    def boards() -> JSONResponse:
+    def boards() -> Response:
         env_path = os.getenv("MRC_BOARDS_PATH")
         boards_dir = settings.storage_dir / "boards"
         path = Path(env_path) if env_path else boards_dir / "boards.json"
         seed = os.getenv("MRC_SEED", DEFAULT_SEED)
-        map_labels = (os.getenv("MRC_BOARD_LABEL_MAP") or "").strip().lower() in ("1", "true", "yes", "on")
+        map_labels = (os.getenv("MRC_BOARD_LABEL_MAP") or "").strip().lower() in ENV_FLAG_VALUES
         carddeck_path = Path(os.getenv("MRC_CARDDECK_PATH", str(app.state.base_dir / "CardDeck.md")))
 
         # Auto-generate boards.json from the latest upload if needed.
         if env_path is None:
-            boards_dir.mkdir(parents=True, exist_ok=True)
-            uploads = sorted(boards_dir.glob("upload-*.xlsx"), key=lambda p: p.stat().st_mtime)
-            latest_upload = uploads[-1] if uploads else None
-            if latest_upload and (not path.exists() or latest_upload.stat().st_mtime > path.stat().st_mtime):
+            latest_upload = _latest_upload(boards_dir)
+            if latest_upload is not None and _mtime_ns(latest_upload) > _mtime_ns(path):
                 boards_data = generate_boards_from_xlsx(
                     latest_upload,
                     carddeck_path,
@@ -1106,31 +1344,29 @@ def create_app() -> FastAPI:
                 )
                 write_boards_json(boards_data, path)
 
-        if not path.exists():
+        boards_mtime = _mtime_ns(path)
+        if boards_mtime < 0:
             raise HTTPException(status_code=404, detail="boards not found")
-        data = load_boards_json(
-            path,
-            carddeck_path=carddeck_path,
-            label_seed=seed,
-            apply_label_map=map_labels,
+        body = _cached_boards_body(
+            str(path), boards_mtime, str(carddeck_path), _mtime_ns(carddeck_path), seed, map_labels
         )
-        if not data:
+        if body is None:
             raise HTTPException(status_code=500, detail="boards invalid")
-        return JSONResponse(content=data)
+        return Response(content=body, media_type="application/json")
 
     @app.post("/api/v1/submissions")
-    async def submit(request: Request, files: list[UploadFile] | None = File(None)) -> dict[str, Any]:
+    async def submit(request: Request, files: list[UploadFile] | None = File(None)) -> JSONResponse:
         form = await request.form()
         submit_key = (request.headers.get("x-mrc-submit-key") or form.get("submit_key") or "").strip()
         if settings.api_key and submit_key != settings.api_key:
             raise HTTPException(status_code=401, detail="제출 키가 올바르지 않습니다.")
 
         token_event = (str(form.get("token_event") or "").strip().lower() or None)
-        if token_event not in (None, "earned", "seal", "shield"):
+        if token_event not in TOKEN_EVENTS:
             raise HTTPException(status_code=400, detail="token_event 값이 올바르지 않습니다.")
 
         files = files or []
-        if not files and token_event not in ("seal", "shield"):
+        if not files and token_event not in SPEND_TOKEN_EVENTS:
             raise HTTPException(status_code=400, detail="스크린샷 파일을 1개 이상 첨부하세요.")
         if len(files) > settings.max_files:
             raise HTTPException(status_code=400, detail=f"파일은 최대 {settings.max_files}개까지 가능합니다.")
@@ -1154,7 +1390,7 @@ def create_app() -> FastAPI:
                 )
 
         seed = (os.getenv("MRC_SEED", DEFAULT_SEED) or DEFAULT_SEED).strip() or DEFAULT_SEED
-        map_labels = (os.getenv("MRC_BOARD_LABEL_MAP") or "").strip().lower() in ("1", "true", "yes", "on")
+        map_labels = (os.getenv("MRC_BOARD_LABEL_MAP") or "").strip().lower() in ENV_FLAG_VALUES
         carddeck_path = Path(os.getenv("MRC_CARDDECK_PATH", str(app.state.base_dir / "CardDeck.md")))
 
         claimed_raw = [str(v) for v in form.getlist("claimed_labels")]
@@ -1170,15 +1406,16 @@ def create_app() -> FastAPI:
 
         resolved_codes: list[str] = []
         if claimed_labels:
-            board_codes_map = _load_board_codes(
+            board_codes_map = await run_in_threadpool(
+                _load_board_codes,
                 settings.storage_dir,
                 carddeck_path=carddeck_path,
                 seed=seed,
                 map_labels=map_labels,
             )
             player_board_codes = board_codes_map.get(player_name)
-
-            label_map = build_label_map(seed)
+            # Only players without a generated board claim seed labels that need the label map.
+            by_label = build_label_map(seed).by_label if player_board_codes is None else {}
             invalid_labels: list[str] = []
             missing_on_board: list[str] = []
 
@@ -1196,10 +1433,11 @@ def create_app() -> FastAPI:
                 if label in CARDS:
                     resolved_codes.append(label)
                     continue
-                if label not in label_map.by_label:
+                code = by_label.get(label)
+                if code is None:
                     invalid_labels.append(label)
                     continue
-                resolved_codes.append(label_map.by_label[label])
+                resolved_codes.append(code)
 
             if invalid_labels:
                 raise HTTPException(
@@ -1230,47 +1468,19 @@ def create_app() -> FastAPI:
             )
         group_tiers = tuple(group_tiers_list) or None
 
+        form_get = form.get
         payload = RunPayload(
             tier=tier,
-            run_date=_parse_date(form.get("run_date")),
-            start_time=_parse_time(form.get("start_time")),
-            distance_km=_parse_float(form.get("distance_km")),
-            duration_min=_parse_int(form.get("duration_min")),
-            temperature_c=_parse_float(form.get("temperature_c")),
-            feels_like_c=_parse_float(form.get("feels_like_c")),
-            wind_m_s=_parse_float(form.get("wind_m_s")),
-            precipitation=(str(form.get("precipitation") or "none").strip().lower() or "none"),
-            is_track=_parse_bool(form.get("is_track")),
-            is_treadmill=_parse_bool(form.get("is_treadmill")),
-            elevation_gain_m=_parse_int(form.get("elevation_gain_m")),
-            hill_repeats=_parse_int(form.get("hill_repeats")),
-            has_light_gear=_parse_bool(form.get("has_light_gear")),
-            is_silent=_parse_bool(form.get("is_silent")),
-            with_new_runner=_parse_bool(form.get("with_new_runner")),
-            did_warmup=_parse_bool(form.get("did_warmup")),
-            did_cooldown=_parse_bool(form.get("did_cooldown")),
-            did_foam_roll=_parse_bool(form.get("did_foam_roll")),
-            did_strength=_parse_bool(form.get("did_strength")),
-            did_drills=_parse_bool(form.get("did_drills")),
-            did_log=_parse_bool(form.get("did_log")),
-            is_new_route=_parse_bool(form.get("is_new_route")),
-            is_build_up=_parse_bool(form.get("is_build_up")),
-            is_pacing=_parse_bool(form.get("is_pacing")),
-            is_level_mix=_parse_bool(form.get("is_level_mix")),
-            is_group=_parse_bool(form.get("is_group")),
-            group_size=_parse_int(form.get("group_size")),
             group_tiers=group_tiers,
-            day_runners_count=_parse_int(form.get("day_runners_count")),
-            is_thursday_meeting=_parse_bool(form.get("is_thursday_meeting")),
-            is_bungae=_parse_bool(form.get("is_bungae")),
-            is_host=_parse_bool(form.get("is_host")),
-            after_social=_parse_bool(form.get("after_social")),
-            is_easy=_parse_bool(form.get("is_easy")),
+            **{name: parser(form_get(name)) for name, parser in RUN_FORM_FIELDS},
         )
 
-        tz_name = os.getenv("MRC_JOB_TIMEZONE", "Asia/Seoul")
-        active_seals = storage.get_active_seals(player_name=player_name, tz=ZoneInfo(tz_name))
-        active_seal_types = {item.get("type") for item in active_seals if item.get("type")}
+        active_seals = await run_in_threadpool(storage.get_active_seals, player_name=player_name, tz=_job_tz())
+        seals_by_type: dict[str, dict[str, Any]] = {}
+        for item in active_seals:
+            if item.get("type"):
+                seals_by_type.setdefault(item["type"], item)
+        active_seal_types = set(seals_by_type)
         seal_blocks = token_event != "shield"
 
         validations: list[dict[str, Any]] = []
@@ -1278,11 +1488,7 @@ def create_app() -> FastAPI:
             for label, code in zip(claimed_labels, resolved_codes, strict=False):
                 card = CARDS.get(code)
                 if seal_blocks and card and card.card_type in active_seal_types:
-                    seal_info = next(
-                        (item for item in active_seals if item.get("type") == card.card_type),
-                        {},
-                    )
-                    seal_remaining = seal_info.get("remaining_runs")
+                    seal_remaining = seals_by_type[card.card_type].get("remaining_runs")
                     status = "failed"
                     remaining_text = f"{seal_remaining}회" if seal_remaining is not None else "2회"
                     reasons = [f"Seal 봉인: {card.card_type} 타입은 다음 {remaining_text} 러닝 동안 체크 불가"]
@@ -1290,7 +1496,7 @@ def create_app() -> FastAPI:
                     status, reasons = evaluate_card(code, payload)
                 validations.append(
                     {
-                        "label": label.strip().upper(),
+                        "label": label,
                         "resolved_code": code,
                         "type": card.card_type if card else None,
                         "stars": card.stars if card else None,
@@ -1299,35 +1505,30 @@ def create_app() -> FastAPI:
                     }
                 )
 
+        status_counts = Counter(v["status"] for v in validations)
         summary = {
-            "passed": sum(1 for v in validations if v["status"] == "passed"),
-            "failed": sum(1 for v in validations if v["status"] == "failed"),
-            "needs_review": sum(1 for v in validations if v["status"] == "needs_review"),
+            "passed": status_counts["passed"],
+            "failed": status_counts["failed"],
+            "needs_review": status_counts["needs_review"],
         }
 
-        review_cards: dict[str, str] = {}
-        for card in validations:
-            code = card.get("resolved_code") or card.get("label")
-            if not code:
-                continue
-            review_cards[code] = "pending"
-
-        submission_id = new_submission_id()
-        submission_dir = storage.create_submission_dir(submission_id)
+        review_cards = {v["resolved_code"]: "pending" for v in validations}
 
-        stored_files = []
-        for upload in files:
-            content = await _read_upload_limited(upload, max_bytes=settings.max_file_bytes)
-            stored_files.append(storage.save_file(submission_dir, upload.filename or "upload", content))
-
-        created_at = utc_now_iso()
-        notes = str(form.get("notes") or "").strip() or None
+        token_hold = None
+        seal_target = str(form.get("seal_target") or "").strip() or None
+        seal_type = (str(form.get("seal_type") or "").strip().upper() or None)
+        if seal_type and seal_type not in SEAL_TYPES:
+            raise HTTPException(status_code=400, detail="seal_type 값이 올바르지 않습니다.")
+        log_summary = str(form.get("log_summary") or "").strip() or None
+        # Token checks run before anything is written so a rejected token request leaves no files behind.
         if token_event == "seal":
             if not seal_target:
                 raise HTTPException(status_code=400, detail="Seal 대상이 필요합니다.")
             if not seal_type:
                 raise HTTPException(status_code=400, detail="Seal 타입(B/C)을 선택하세요.")
-            if storage.has_pending_or_active_seal(seal_target=seal_target, seal_type=seal_type):
+            if await run_in_threadpool(
+                storage.has_pending_or_active_seal, seal_target=seal_target, seal_type=seal_type
+            ):
                 raise HTTPException(status_code=400, detail="이미 동일 타입 봉인이 진행 중입니다.")
         if token_event == "shield":
             if not seal_type:
@@ -1336,19 +1537,47 @@ def create_app() -> FastAPI:
                 raise HTTPException(status_code=400, detail="현재 봉인 상태가 아닙니다.")
             if seal_type not in active_seal_types:
                 raise HTTPException(status_code=400, detail="해당 타입 봉인이 없습니다.")
-        if token_event in ("seal", "shield"):
-            available, _, _ = storage.compute_token_balance(player_name=player_name, tier=tier)
+        if token_event in SPEND_TOKEN_EVENTS:
+            available, _, _ = await run_in_threadpool(
+                storage.compute_token_balance, player_name=player_name, tier=tier
+            )
             if available <= 0:
                 raise HTTPException(
                     status_code=400,
                     detail="사용 가능한 토큰이 없습니다. W 카드 달성 후 다시 시도하세요.",
                 )
-        token_hold = None
-        seal_target = str(form.get("seal_target") or "").strip() or None
-        seal_type = (str(form.get("seal_type") or "").strip().upper() or None)
-        if seal_type and seal_type not in ("B", "C"):
-            raise HTTPException(status_code=400, detail="seal_type 값이 올바르지 않습니다.")
-        log_summary = str(form.get("log_summary") or "").strip() or None
+
+        submission_id = new_submission_id()
+        submission_dir = await run_in_threadpool(storage.create_submission_dir, submission_id)
+
+        # Names are reserved up front so same-named uploads cannot collide, then all files are written concurrently.
+        out_paths: list[Path] = []
+        for upload in files:
+            out_paths.append(storage.new_file_path(submission_dir, upload.filename or "upload", reserved=out_paths))
+        writes = [
+            asyncio.ensure_future(_read_upload_limited(upload, max_bytes=settings.max_file_bytes, dest=out_path))
+            for upload, out_path in zip(files, out_paths)
+        ]
+        try:
+            sizes = await asyncio.gather(*writes)
+        except BaseException:
+            # A rejected file (e.g. over the size limit) must not leave the others behind.
+            for write in writes:
+                write.cancel()
+            await asyncio.gather(*writes, return_exceptions=True)
+            await run_in_threadpool(shutil.rmtree, submission_dir, ignore_errors=True)
+            raise
+        stored_files = [
+            StoredFile(
+                filename=upload.filename or "upload",
+                stored_as=str(out_path.relative_to(submission_dir)),
+                size_bytes=size_bytes,
+            )
+            for upload, out_path, size_bytes in zip(files, out_paths, sizes)
+        ]
+
+        created_at = utc_now_iso()
+        notes = str(form.get("notes") or "").strip() or None
 
         review_status = "pending"
         reviewed_at = None
@@ -1395,8 +1624,11 @@ def create_app() -> FastAPI:
             },
         }
 
-        storage.write_meta(submission_dir, meta)
-        storage.insert_index(
+        # The admin detail and file routes read only meta.json, so it must exist before the index row lists it.
+        await run_in_threadpool(storage.write_meta, submission_dir, meta)
+        run_day = _effective_run_day(payload.run_date, created_at)
+        await run_in_threadpool(
+            storage.insert_index,
             submission_id=submission_id,
             created_at=created_at,
             player_name=player_name,
@@ -1422,32 +1654,28 @@ def create_app() -> FastAPI:
             files=stored_files,
             user_agent=request.headers.get("user-agent"),
             client_ip=_client_ip(request),
+            # Only the latest card submission per runner and day counts; older ones are rejected in the same commit.
+            supersede_run_day=run_day if resolved_codes else None,
         )
-        run_day = _effective_run_day(payload.run_date, created_at)
-        if run_day and resolved_codes:
-            storage.reject_previous_submissions(
-                player_name=player_name,
-                keep_id=submission_id,
-                run_day=run_day,
-                reviewed_at=created_at,
-            )
 
-        return {
-            "id": submission_id,
-            "created_at": created_at,
-            "player_name": player_name,
-            "tier": tier,
-            "seed": seed,
-            "claimed_labels": [l.strip().upper() for l in claimed_labels],
-            "resolved_codes": resolved_codes,
-            "rule_messages": rule_msgs,
-            "validation": validations,
-            "summary": summary,
-            "stored_files": [f.__dict__ for f in stored_files],
-        }
+        return JSONResponse(
+            content={
+                "id": submission_id,
+                "created_at": created_at,
+                "player_name": player_name,
+                "tier": tier,
+                "seed": seed,
+                "claimed_labels": claimed_labels,
+                "resolved_codes": resolved_codes,
+                "rule_messages": rule_msgs,
+                "validation": validations,
+                "summary": summary,
+                "stored_files": [f.__dict__ for f in stored_files],
+            }
+        )
 
     @app.get("/admin")
-    def admin(request: Request, status: str = "pending") -> HTMLResponse:
+    def admin(request: Request, status: str = "pending") -> Response:
         key = _admin_key_from(request)
         if settings.admin_key and key != settings.admin_key:
             message = "운영진 키가 필요합니다." if not key else "운영진 키가 올바르지 않습니다."
@@ -1456,40 +1684,54 @@ def create_app() -> FastAPI:
                 next_path = f"{next_path}?{request.url.query}"
             return HTMLResponse(_render_admin_login(next_path, message), status_code=401)
         status_value = (status or "pending").lower()
-        if status_value == "all":
-            items = storage.list_submissions(status=None, limit=2000)
-        else:
-            items = storage.list_submissions(status=status_value, limit=200)
+        list_status = None if status_value == "all" else status_value
+        index_limit = 2000 if status_value == "all" else 200
         run_date_filter = (request.query_params.get("run_date") or "").strip() or None
         runner_filter = (request.query_params.get("runner") or "").strip() or None
-        index_items = items
-        if runner_filter:
-            items = [item for item in items if item.get("player_name") == runner_filter]
-        if run_date_filter:
-            items = [item for item in items if item.get("run_date") == run_date_filter]
+        before, page_size = _admin_paging(request)
+        # One extra row tells us whether there is a next page; its cursor is the last shown created_at.
+        items = storage.list_submissions(
+            status=list_status,
+            player_name=runner_filter,
+            run_date=run_date_filter,
+            before=before,
+            limit=page_size + 1,
+        )
+        next_cursor = None
+        if len(items) > page_size:
+            items = items[:page_size]
+            next_cursor = items[-1].get("created_at")
+        index_items = storage.list_submission_index(status=list_status, limit=index_limit)
+        status_counts = storage.count_by_status()
         carddeck_path = Path(os.getenv("MRC_CARDDECK_PATH", str(app.state.base_dir / "CardDeck.md")))
         card_titles = _load_card_titles(carddeck_path)
         boards_path = settings.storage_dir / "boards" / "boards.json"
-        boards_meta = "none"
-        if boards_path.exists():
-            try:
-                meta = json.loads(boards_path.read_text(encoding="utf-8"))
-                boards_meta = _format_boards_meta(meta, boards_path.name)
-            except json.JSONDecodeError:
-                boards_meta = _format_boards_meta(None, boards_path.name)
+        try:
+            meta = _load_json_cached(str(boards_path), boards_path.stat().st_mtime_ns)
+        except FileNotFoundError:
+            boards_meta = "none"
+        except (OSError, ValueError):
+            boards_meta = _format_boards_meta(None, boards_path.name)
+        else:
+            boards_meta = _format_boards_meta(meta if isinstance(meta, dict) else None, boards_path.name)
         message = request.query_params.get("msg") or ""
-        return HTMLResponse(
-            _render_admin_page(
+        return StreamingResponse(
+            _iter_admin_page(
                 items=items,
                 index_items=index_items,
-                status=status,
+                status=status_value,
                 message=message,
                 boards_meta=boards_meta,
                 card_titles=card_titles,
                 run_date_filter=run_date_filter,
                 runner_filter=runner_filter,
                 admin_key=key,
-            )
+                status_counts=status_counts,
+                before=before,
+                next_cursor=next_cursor,
+                page_size=page_size,
+            ),
+            media_type="text/html",
         )
 
     @app.post("/admin/login")
@@ -1538,7 +1780,7 @@ def create_app() -> FastAPI:
         )
 
     @app.get("/admin/submissions/{submission_id}/files/{file_index}")
-    def admin_submission_file(submission_id: str, file_index: int, request: Request) -> FileResponse:
+    def admin_submission_file(submission_id: str, file_index: int, request: Request) -> Response:
         _require_admin(settings, request)
         meta = _load_submission_meta(storage, submission_id)
         if not meta:
@@ -1549,16 +1791,24 @@ def create_app() -> FastAPI:
         stored_as = files[file_index].get("stored_as")
         if not stored_as:
             raise HTTPException(status_code=404, detail="file not found")
-        submission_dir = storage.submissions_dir / submission_id
-        file_path = (submission_dir / stored_as).resolve()
-        try:
-            file_path.relative_to(submission_dir.resolve())
-        except ValueError:
+        submission_root = storage.submissions_root / submission_id
+        file_path = (submission_root / stored_as).resolve()
+        # The trailing separator keeps sibling directories sharing the id as a prefix from matching.
+        if not str(file_path).startswith(f"{submission_root}{os.sep}"):
             raise HTTPException(status_code=400, detail="invalid file path")
-        if not file_path.exists():
+        try:
+            stat_result = file_path.stat()
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail="file not found")
-        media_type, _ = mimetypes.guess_type(str(file_path))
-        return FileResponse(file_path, media_type=media_type or "application/octet-stream")
+        response = FileResponse(
+            file_path,
+            media_type=_media_type(file_path.suffix.lower()),
+            stat_result=stat_result,
+            headers={"Cache-Control": SUBMISSION_FILE_CACHE_CONTROL},
+        )
+        if _is_not_modified(request, response):
+            return Response(status_code=304, headers={k: response.headers[k] for k in NOT_MODIFIED_HEADERS})
+        return response
 
     @app.post("/admin/review/{submission_id}")
     async def admin_review(submission_id: str, request: Request) -> RedirectResponse:
@@ -1566,14 +1816,16 @@ def create_app() -> FastAPI:
         key = _require_admin(settings, request, dict(form))
         run_date = (request.query_params.get("run_date") or "").strip() or None
         runner = (request.query_params.get("runner") or "").strip() or None
+        before, page_size = _admin_paging(request)
         status = (form.get("review_status") or "").strip().lower()
-        if status not in ("approved", "rejected", "pending"):
+        if status not in REVIEW_STATUSES:
             raise HTTPException(status_code=400, detail="review_status invalid")
         card_code = (form.get("card_code") or "").strip() or None
         reviewer = str(form.get("reviewer") or "").strip() or None
         notes = str(form.get("review_notes") or "").strip() or None
         if card_code:
-            storage.update_card_review_status(
+            await run_in_threadpool(
+                storage.update_card_review_status,
                 submission_id=submission_id,
                 card_code=card_code,
                 status=status,
@@ -1583,7 +1835,8 @@ def create_app() -> FastAPI:
             )
             message = f"카드 리뷰 업데이트 완료 ({card_code})"
         else:
-            storage.update_review_status(
+            await run_in_threadpool(
+                storage.update_review_status,
                 submission_id=submission_id,
                 status=status,
                 reviewed_at=utc_now_iso(),
@@ -1592,9 +1845,12 @@ def create_app() -> FastAPI:
             )
             message = "리뷰 업데이트 완료"
         if _parse_bool(os.getenv("MRC_ADMIN_AUTO_PUBLISH")):
-            _, publish_message = _run_publish_now(settings.storage_dir)
+            _, publish_message = await run_in_threadpool(_run_publish_now, settings.storage_dir)
             message = f"{message} · {publish_message}"
-        redirect = f"/admin?{_build_admin_query(status=status, run_date=run_date, runner=runner, msg=message)}"
+        redirect_query = _build_admin_query(
+            status=status, run_date=run_date, runner=runner, msg=message, before=before, page_size=page_size
+        )
+        redirect = f"/admin?{redirect_query}"
         return RedirectResponse(url=redirect, status_code=303)
 
     @app.post("/admin/publish")
@@ -1607,8 +1863,12 @@ def create_app() -> FastAPI:
         key = _require_admin(settings, request, dict(form) | {"admin_key": admin_key})
         run_date = (request.query_params.get("run_date") or "").strip() or None
         runner = (request.query_params.get("runner") or "").strip() or None
-        _, message = _run_publish_now(settings.storage_dir)
-        redirect = f"/admin?{_build_admin_query(status=status, run_date=run_date, runner=runner, msg=message)}"
+        before, page_size = _admin_paging(request)
+        _, message = await run_in_threadpool(_run_publish_now, settings.storage_dir)
+        redirect_query = _build_admin_query(
+            status=status, run_date=run_date, runner=runner, msg=message, before=before, page_size=page_size
+        )
+        redirect = f"/admin?{redirect_query}"
         return RedirectResponse(url=redirect, status_code=303)
 
     @app.post("/admin/boards/upload")
@@ -1620,24 +1880,27 @@ def create_app() -> FastAPI:
         key = _require_admin(settings, request, {"admin_key": admin_key})
         if not file.filename:
             raise HTTPException(status_code=400, detail="file required")
-        data = await file.read()
         boards_dir = settings.storage_dir / "boards"
-        boards_dir.mkdir(parents=True, exist_ok=True)
+        await run_in_threadpool(boards_dir.mkdir, parents=True, exist_ok=True)
         safe_name = Path(file.filename).name.replace("/", "_").replace("\\", "_")
         upload_path = boards_dir / f"upload-{safe_name}"
-        upload_path.write_bytes(data)
+        # Stream into a name the boards endpoint's upload-*.xlsx glob cannot pick up, then swap it in.
+        part_path = boards_dir / f".{upload_path.name}.part"
+        await _read_upload_limited(file, max_bytes=settings.max_file_bytes, dest=part_path)
+        await run_in_threadpool(os.replace, part_path, upload_path)
 
         carddeck_path = Path(os.getenv("MRC_CARDDECK_PATH", str(app.state.base_dir / "CardDeck.md")))
         seed = os.getenv("MRC_SEED", DEFAULT_SEED)
-        use_label_map = (os.getenv("MRC_BOARD_LABEL_MAP") or "").strip().lower() in ("1", "true", "yes", "on")
-        boards_data = generate_boards_from_xlsx(
+        use_label_map = (os.getenv("MRC_BOARD_LABEL_MAP") or "").strip().lower() in ENV_FLAG_VALUES
+        boards_data = await run_in_threadpool(
+            generate_boards_from_xlsx,
             upload_path,
             carddeck_path,
             label_seed=seed,
             use_label_map=use_label_map,
         )
         out_path = boards_dir / "boards.json"
-        write_boards_json(boards_data, out_path)
+        await run_in_threadpool(write_boards_json, boards_data, out_path)
 
         redirect = "/admin?status=pending&msg=boards+updated"
         return RedirectResponse(url=redirect, status_code=303)
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import re
+import secrets
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from xml.etree import ElementTree as ET
@@ -14,6 +17,21 @@ from .label_map import build_label_map
 
 
 NS = {"s": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+SI_TAG = f"{{{NS['s']}}}si"
+T_TAG = f"{{{NS['s']}}}t"
+ROW_TAG = f"{{{NS['s']}}}row"
+CELL_COLUMN = re.compile(r"([A-Z]+)")
+CELL_CODE = re.compile(r"([ABCDW]\d{2})")
+CARDDECK_LINE = re.compile(r"^([ABCDW]\d{2})\s+(★+)\s+(.+)$")
+GRID_HEADERS = tuple(tuple(f"{r}행 {c}열" for c in range(1, 6)) for r in range(1, 6))
+SURVEY_TIERS = {
+    "초보": "beginner",
+    "중수": "intermediate",
+    "고수": "advanced",
+    "beginner": "beginner",
+    "intermediate": "intermediate",
+    "advanced": "advanced",
+}
 
 
 @dataclass(frozen=True)
@@ -25,11 +43,16 @@ class CardDef:
 
 
 def parse_carddeck(path: Path) -> dict[str, CardDef]:
-    pattern = re.compile(r"^([ABCDW]\d{2})\s+(★+)\s+(.+)$")
+    # Shared across callers until CardDeck.md changes on disk; do not mutate the result.
+    return _parse_carddeck_cached(str(path), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _parse_carddeck_cached(path: str, mtime_ns: int) -> dict[str, CardDef]:
     cards: dict[str, CardDef] = {}
-    for line in path.read_text(encoding="utf-8").splitlines():
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
         line = line.strip()
-        m = pattern.match(line)
+        m = CARDDECK_LINE.match(line)
         if not m:
             continue
         code, stars, title = m.groups()
@@ -43,12 +66,12 @@ def parse_carddeck(path: Path) -> dict[str, CardDef]:
 
 
 def _parse_shared_strings(z: ZipFile) -> list[str]:
-    shared_xml = z.read("xl/sharedStrings.xml")
-    root = ET.fromstring(shared_xml)
     shared: list[str] = []
-    for si in root.findall("s:si", NS):
-        texts = [t.text or "" for t in si.findall(".//s:t", NS)]
-        shared.append("".join(texts))
+    with z.open("xl/sharedStrings.xml") as fh:
+        for _, el in ET.iterparse(fh, events=("end",)):
+            if el.tag == SI_TAG:
+                shared.append("".join(t.text or "" for t in el.iter(T_TAG)))
+                el.clear()
     return shared
 
 
@@ -66,23 +89,24 @@ def _cell_value(cell: ET.Element, shared: list[str]) -> str:
 
 
 def _parse_sheet_rows(z: ZipFile) -> list[dict[str, str]]:
-    sheet_xml = z.read("xl/worksheets/sheet1.xml")
-    root = ET.fromstring(sheet_xml)
     shared = _parse_shared_strings(z)
 
     rows: list[dict[str, str]] = []
-    for row in root.findall(".//s:row", NS):
-        cells: dict[str, str] = {}
-        for cell in row.findall("s:c", NS):
-            ref = cell.get("r")
-            if not ref:
+    with z.open("xl/worksheets/sheet1.xml") as fh:
+        for _, el in ET.iterparse(fh, events=("end",)):
+            if el.tag != ROW_TAG:
                 continue
-            col = re.match(r"([A-Z]+)", ref)
-            if not col:
-                continue
-            col_id = col.group(1)
-            cells[col_id] = _cell_value(cell, shared)
-        rows.append(cells)
+            cells: dict[str, str] = {}
+            for cell in el.findall("s:c", NS):
+                ref = cell.get("r")
+                if not ref:
+                    continue
+                col = CELL_COLUMN.match(ref)
+                if not col:
+                    continue
+                cells[col.group(1)] = _cell_value(cell, shared)
+            rows.append(cells)
+            el.clear()
     return rows
 
 
@@ -97,7 +121,7 @@ def _excel_serial_to_iso(value: str) -> str | None:
 
 
 def _resolve_code(raw: str) -> str | None:
-    m = re.search(r"([ABCDW]\d{2})", raw or "")
+    m = CELL_CODE.search(raw or "")
     return m.group(1) if m else None
 
 
@@ -105,19 +129,12 @@ def _normalize_tier(raw: str) -> tuple[str | None, str | None]:
     value = (raw or "").strip()
     if not value:
         return None, None
-    normalized = value.lower()
-    mapping = {
-        "초보": "beginner",
-        "중수": "intermediate",
-        "고수": "advanced",
-        "beginner": "beginner",
-        "intermediate": "intermediate",
-        "advanced": "advanced",
-    }
-    tier = mapping.get(value, mapping.get(normalized))
+    tier = SURVEY_TIERS.get(value) or SURVEY_TIERS.get(value.lower())
     return tier, value
 
 
+# Board and player ids end up in progress.json and the SQLite player_id columns, and
+# tools/generate_boards.py derives the same ids; keep sha1[:10] so they stay stable across regenerations.
 def _stable_id(value: str) -> str:
     digest = hashlib.sha1(value.encode("utf-8")).hexdigest()
     return digest[:10]
@@ -133,18 +150,20 @@ def _map_code(code: str | None, label_map) -> tuple[str | None, str | None]:
     return resolved, label
 
 
+def _grid_columns(header_to_col: dict[str, str]) -> list[list[str | None]]:
+    return [[header_to_col.get(header) for header in headers] for headers in GRID_HEADERS]
+
+
 def _build_grid(
     row: dict[str, str],
-    header_to_col: dict[str, str],
+    grid_cols: list[list[str | None]],
     cards: dict[str, CardDef],
     label_map,
 ) -> list[list[dict[str, Any]]]:
     grid: list[list[dict[str, Any]]] = []
-    for r in range(1, 6):
+    for cols in grid_cols:
         row_cells: list[dict[str, Any]] = []
-        for c in range(1, 6):
-            header = f"{r}행 {c}열"
-            col = header_to_col.get(header)
+        for col in cols:
             raw = row.get(col, "") if col else ""
             raw_code = _resolve_code(raw)
             code, label = _map_code(raw_code, label_map)
@@ -186,22 +205,27 @@ def generate_boards_from_xlsx(
 
     header_row = rows[0]
     header_to_col = {header: col for col, header in header_row.items()}
+    name_col = header_to_col.get("이름", "")
+    timestamp_col = header_to_col.get("타임스탬프", "")
+    email_col = header_to_col.get("이메일 주소", "")
+    tier_col = header_to_col.get("내 티어", "")
+    grid_cols = _grid_columns(header_to_col)
 
     boards = []
     for row in rows[1:]:
-        name = row.get(header_to_col.get("이름", ""), "").strip()
+        name = row.get(name_col, "").strip()
         if not name:
             continue
-        timestamp_raw = row.get(header_to_col.get("타임스탬프", ""), "")
+        timestamp_raw = row.get(timestamp_col, "")
         timestamp = _excel_serial_to_iso(timestamp_raw) or timestamp_raw or None
-        email = row.get(header_to_col.get("이메일 주소", ""), "").strip() or None
-        tier_raw = row.get(header_to_col.get("내 티어", ""), "").strip()
+        email = row.get(email_col, "").strip() or None
+        tier_raw = row.get(tier_col, "").strip()
         tier, tier_label = _normalize_tier(tier_raw)
 
         player_id = f"player-{_stable_id(name + '|' + (email or ''))}"
         board_key = f"{name}|{timestamp_raw or ''}|{email or ''}"
         board_id = f"board-{_stable_id(board_key)}"
-        grid = _build_grid(row, header_to_col, cards, label_map)
+        grid = _build_grid(row, grid_cols, cards, label_map)
         boards.append(
             {
                 "id": board_id,
@@ -227,16 +251,27 @@ def generate_boards_from_xlsx(
 
 def write_boards_json(data: dict[str, Any], out_path: Path) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    # Encode straight into a sibling temp file, then swap it in so readers never see a partial boards.json.
+    tmp_path = out_path.with_name(f".{out_path.name}.{secrets.token_hex(4)}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8", buffering=1024 * 1024) as fh:
+            json.dump(data, fh, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def _has_label_field(data: dict[str, Any]) -> bool:
-    for board in data.get("boards", []) if isinstance(data, dict) else []:
-        for row in (board or {}).get("grid", []):
-            for cell in row or []:
-                if isinstance(cell, dict) and "label" in cell:
-                    return True
-    return False
+    if not isinstance(data, dict):
+        return False
+    return any(
+        "label" in cell
+        for board in data.get("boards", [])
+        for row in (board or {}).get("grid", [])
+        for cell in row or []
+        if isinstance(cell, dict)
+    )
 
 
 def apply_label_map_to_boards(
@@ -247,31 +282,43 @@ def apply_label_map_to_boards(
 ) -> dict[str, Any]:
     if not isinstance(data, dict):
         return data
-    if data.get("label_map_applied") or data.get("code_basis") == "actual" or _has_label_field(data):
+    if data.get("label_map_applied") or data.get("code_basis") == "actual":
+        return data
+    if _has_label_field(data):
         return data
 
     label_map = build_label_map(label_seed)
     cards = parse_carddeck(carddeck_path)
 
-    out = json.loads(json.dumps(data, ensure_ascii=False))
-    for board in out.get("boards", []):
-        for row in (board or {}).get("grid", []):
-            for cell in row or []:
-                if not isinstance(cell, dict):
-                    continue
-                code = cell.get("code")
-                if not code:
-                    continue
-                actual = label_map.by_label.get(code, code)
-                if actual == code:
-                    continue
-                cell.setdefault("label", code)
-                cell["code"] = actual
-                card = cards.get(actual)
-                if card:
-                    cell["type"] = card.card_type
-                    cell["stars"] = card.stars
-                    cell["title"] = card.title
+    def relabel(cell: Any) -> Any:
+        if not isinstance(cell, dict):
+            return cell
+        code = cell.get("code")
+        if not code:
+            return cell
+        actual = label_map.by_label.get(code, code)
+        if actual == code:
+            return cell
+        cell = dict(cell)
+        cell.setdefault("label", code)
+        cell["code"] = actual
+        card = cards.get(actual)
+        if card:
+            cell["type"] = card.card_type
+            cell["stars"] = card.stars
+            cell["title"] = card.title
+        return cell
+
+    # Copy only the containers on the way to relabelled cells; everything else is shared with `data`.
+    out = dict(data)
+    if "boards" in data:
+        boards = []
+        for board in data["boards"]:
+            if isinstance(board, dict) and board.get("grid"):
+                board = dict(board)
+                board["grid"] = [[relabel(cell) for cell in row] if row else row for row in board["grid"]]
+            boards.append(board)
+        out["boards"] = boards
 
     out["label_map_applied"] = True
     out["code_basis"] = "actual"
@@ -286,11 +333,9 @@ def load_boards_json(
     label_seed: str | None,
     apply_label_map: bool,
 ) -> dict[str, Any] | None:
-    if not boards_path.exists():
-        return None
     try:
-        data = json.loads(boards_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+        data = json.loads(boards_path.read_bytes())
+    except (FileNotFoundError, ValueError):
         return None
     if apply_label_map and carddeck_path and label_seed:
         return apply_label_map_to_boards(data, label_seed=label_seed, carddeck_path=carddeck_path)
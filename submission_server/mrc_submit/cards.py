@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Literal
+from typing import Literal, get_args
 
 
 Tier = Literal["beginner", "intermediate", "advanced"]
@@ -83,8 +83,10 @@ CARDS: dict[str, CardDef] = {
 }
 
 
-CARDS_BY_TYPE: dict[CardType, list[str]] = {"A": [], "B": [], "C": [], "D": [], "W": []}
-for _code, _card in CARDS.items():
-    CARDS_BY_TYPE[_card.card_type].append(_code)
-for _t in CARDS_BY_TYPE:
-    CARDS_BY_TYPE[_t].sort()
+# CARDS is written in code order, so each type's codes come out sorted.
+CARDS_BY_TYPE: dict[CardType, list[str]] = {
+    card_type: [code for code, card in CARDS.items() if card.card_type == card_type]
+    for card_type in get_args(CardType)
+}
+
+STARS_BY_CODE: dict[str, int] = {code: card.stars for code, card in CARDS.items()}
@@ -38,7 +38,10 @@ def load_settings(*, base_dir: Path) -> Settings:
     port = _parse_int(os.getenv("MRC_SUBMIT_PORT"), 8787)
 
     storage_raw = os.getenv("MRC_SUBMIT_STORAGE_DIR", "./storage")
-    storage_dir = (base_dir / storage_raw).resolve() if not Path(storage_raw).is_absolute() else Path(storage_raw)
+    storage_path = Path(storage_raw)
+    # base_dir is already resolved, so lexical normalisation is enough; Storage resolves the
+    # submissions root itself for the file traversal check.
+    storage_dir = storage_path if storage_path.is_absolute() else Path(os.path.normpath(base_dir / storage_path))
 
     allowed_origins = _parse_csv(os.getenv("MRC_SUBMIT_ALLOWED_ORIGINS")) or ["*"]
     api_key = os.getenv("MRC_SUBMIT_API_KEY") or None
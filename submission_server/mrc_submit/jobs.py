@@ -1,19 +1,97 @@
 from __future__ import annotations
 
-import argparse
+import atexit
+import hashlib
 import json
 import os
+import secrets
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime, time as dt_time, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator, TextIO
 from zoneinfo import ZoneInfo
 
 from .boards import load_boards_json
-from .cards import CARDS, TIER_ALIASES
-from .llm import preprocess_submission
+from .cards import CARDS, STARS_BY_CODE, TIER_ALIASES
+from .llm import preprocess_submission, provider_identity
 from .storage import Storage
 
+DEFAULT_CARDDECK_PATH = Path(__file__).resolve().parents[1] / "CardDeck.md"
+SQL_IN_CHUNK = 500
+JOB_DB_CONNECTIONS: dict[str, tuple[int, sqlite3.Connection]] = {}
+JOB_DB_LOCK = threading.Lock()
+# Leading columns of the preprocess SELECT that make up the payload; review_status is last.
+PREPROCESS_PAYLOAD_COLUMNS = 18
+PUBLISH_LOG_LIMIT = 50
+# char(31) in SQL; card codes never contain the ASCII unit separator.
+CODE_LIST_SEP = "\x1f"
+# (row, col) cells of the 12 bingo lines on a 5x5 board: rows, columns, then both diagonals.
+BINGO_LINE_INDICES = (
+    tuple(tuple((r, c) for c in range(5)) for r in range(5))
+    + tuple(tuple((r, c) for r in range(5)) for c in range(5))
+    + (tuple((i, i) for i in range(5)), tuple((i, 4 - i) for i in range(5)))
+)
+# The same lines as 25-bit masks; an empty cell never sets its bit, so its lines never complete.
+BINGO_LINE_MASKS = tuple(sum(1 << (r * 5 + c) for r, c in line) for line in BINGO_LINE_INDICES)
+
+
+def _payload_hash(columns: list[Any]) -> str:
+    # Hashes the raw column values the payload is built from (JSON columns still as text) plus the
+    # LLM provider identity, so an edited submission, a review change or a switched provider
+    # gets a fresh result.
+    return hashlib.sha1(json.dumps(columns, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def _connect_db(db_path: Path) -> sqlite3.Connection:
+    # Autocommit mode: jobs open explicit transactions for their writes. The connection is cached
+    # and the server runs publish from threadpool threads, so it is not tied to one thread.
+    con = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+    # Match the server's WAL/NORMAL setup.
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute("PRAGMA synchronous=NORMAL")
+    con.execute("PRAGMA temp_store=MEMORY")
+    con.execute("PRAGMA cache_size=-20000")
+    con.execute("PRAGMA mmap_size=268435456")
+    con.row_factory = sqlite3.Row
+    return con
+
+
+def _file_id(path: Path) -> int:
+    try:
+        return path.stat().st_ino
+    except OSError:
+        return -1
+
+
+@contextmanager
+def _job_connection(db_path: Path) -> Iterator[sqlite3.Connection]:
+    # One connection per database, reused by every job run in this process (the scheduler loop and the
+    # admin publish button). Runs are serialized on JOB_DB_LOCK; a replaced database file reconnects.
+    with JOB_DB_LOCK:
+        key = str(db_path)
+        cached = JOB_DB_CONNECTIONS.get(key)
+        if cached is None or cached[0] != _file_id(db_path):
+            if cached is not None:
+                cached[1].close()
+            con = _connect_db(db_path)
+            cached = JOB_DB_CONNECTIONS[key] = (_file_id(db_path), con)
+        con = cached[1]
+        try:
+            yield con
+        finally:
+            if con.in_transaction:
+                con.rollback()
+
+
+@atexit.register
+def _close_job_connections() -> None:
+    for _, con in JOB_DB_CONNECTIONS.values():
+        con.close()
+    JOB_DB_CONNECTIONS.clear()
+
 
 def _parse_time(value: str, default: dt_time) -> dt_time:
     raw = (value or "").strip()
@@ -44,9 +122,47 @@ def _load_state(state_path: Path) -> dict[str, Any]:
         return {}
 
 
+@contextmanager
+def _atomic_writer(out_path: Path) -> Iterator[TextIO]:
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    # Write a uniquely named temp file and swap it in; the server may be serving the old copy meanwhile,
+    # and two publishes can overlap.
+    tmp_path = out_path.with_name(f".{out_path.name}.{secrets.token_hex(4)}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8", buffering=1024 * 1024) as fh:
+            yield fh
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _indented_json(value: Any, level: int) -> str:
+    return json.dumps(value, ensure_ascii=False, indent=2).replace("\n", "\n" + " " * level)
+
+
+def _write_json(out_path: Path, data: dict[str, Any]) -> None:
+    with _atomic_writer(out_path) as fh:
+        json.dump(data, fh, ensure_ascii=False, indent=2)
+
+
+def _write_json_items(out_path: Path, head: dict[str, Any], key: str, items: Iterable[dict[str, Any]]) -> None:
+    # Same bytes as _write_json(out_path, {**head, key: list(items)}), but each item is encoded
+    # and written as it is produced instead of holding the whole list.
+    with _atomic_writer(out_path) as fh:
+        fh.write("{")
+        for name, value in head.items():
+            fh.write(f"\n  {json.dumps(name)}: {_indented_json(value, 2)},")
+        fh.write(f"\n  {json.dumps(key)}: [")
+        sep = ""
+        for item in items:
+            fh.write(f"{sep}\n    {_indented_json(item, 4)}")
+            sep = ","
+        fh.write("\n  ]\n}" if sep else "]\n}")
+
+
 def _save_state(state_path: Path, state: dict[str, Any]) -> None:
-    state_path.parent.mkdir(parents=True, exist_ok=True)
-    state_path.write_text(json.dumps(state, ensure_ascii=False, indent=2), encoding="utf-8")
+    _write_json(state_path, state)
 
 
 def _iso_to_dt(value: str | None) -> datetime | None:
@@ -58,9 +174,14 @@ def _iso_to_dt(value: str | None) -> datetime | None:
         return None
 
 
-def _stable_id(value: str) -> str:
-    import hashlib
+@lru_cache(maxsize=256)
+def _local_iso(value: str, tz: ZoneInfo) -> str:
+    parsed = _iso_to_dt(value)
+    return parsed.astimezone(tz).isoformat() if parsed else value
+
 
+@lru_cache(maxsize=1024)
+def _stable_id(value: str) -> str:
     digest = hashlib.sha1(value.encode("utf-8")).hexdigest()
     return digest[:10]
 
@@ -80,6 +201,61 @@ def _token_cap(tier: str | None) -> int:
     return {"beginner": 1, "intermediate": 2, "advanced": 3}.get(tier or "", 1)
 
 
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+@lru_cache(maxsize=4)
+def _cached_board_tables(
+    boards_path: str,
+    boards_mtime_ns: int,
+    carddeck_path: str,
+    carddeck_mtime_ns: int,
+    seed: str,
+    map_labels: bool,
+) -> tuple[
+    dict[str, dict[str, Any]],
+    dict[str, str],
+    dict[str, dict[str, int]],
+    dict[str, frozenset[str]],
+]:
+    # Shared between calls until either file changes: run_publish only reads these.
+    boards_data = load_boards_json(
+        Path(boards_path),
+        carddeck_path=Path(carddeck_path),
+        label_seed=seed,
+        apply_label_map=map_labels,
+    ) or {}
+    board_index: dict[str, dict[str, Any]] = {}
+    board_tiers: dict[str, str] = {}
+    for board in boards_data.get("boards", []) if isinstance(boards_data, dict) else []:
+        if not board:
+            continue
+        name = board.get("name")
+        if not name:
+            continue
+        board_index[name] = board
+        board_tier = _normalize_tier(board.get("tier") or board.get("tier_label"))
+        if board_tier:
+            board_tiers[name] = board_tier
+
+    board_code_bits_by_name: dict[str, dict[str, int]] = {}
+    board_codes_by_name: dict[str, frozenset[str]] = {}
+    for name, board in board_index.items():
+        grid = [
+            [cell.get("code") if cell else None for cell in row_cells]
+            for row_cells in board.get("grid", [])
+        ]
+        cells = _board_cells(grid)
+        if cells:
+            board_code_bits_by_name[name] = _board_code_bits(cells)
+        board_codes_by_name[name] = frozenset(code for grid_row in grid for code in grid_row if code)
+    return board_index, board_tiers, board_code_bits_by_name, board_codes_by_name
+
+
 def _read_boards(boards_path: Path) -> dict[str, Any] | None:
     if not boards_path.exists():
         return None
@@ -97,79 +273,97 @@ def run_preprocess(*, storage_dir: Path, tz: ZoneInfo, cutoff: dt_time) -> Path:
     window_start_utc = window_start.astimezone(timezone.utc)
     window_end_utc = window_end.astimezone(timezone.utc)
 
-    items: list[dict[str, Any]] = []
-    con = sqlite3.connect(db_path)
-    con.row_factory = sqlite3.Row
-    try:
+    label = window_start.date().isoformat()
+    out_path = storage_dir / "preprocess" / f"{label}.json"
+    new_llm_rows: list[tuple[str, str, str]] = []
+    llm_identity = provider_identity()
+    with _job_connection(db_path) as con:
         rows = con.execute(
             """
             SELECT
-              id, created_at, player_name, tier, run_date, start_time,
-              distance_km, duration_min, claimed_labels_json, resolved_codes_json,
-              validation_json, notes, token_event, token_hold, seal_target, seal_type,
-              log_summary, review_status
-            FROM submissions
-            WHERE created_at >= ? AND created_at < ?
-            ORDER BY created_at ASC
+              s.id, s.created_at, s.player_name, s.tier, s.run_date, s.start_time,
+              s.distance_km, s.duration_min, s.claimed_labels_json, s.resolved_codes_json,
+              s.validation_json, s.notes, s.token_event, s.token_hold, s.seal_target, s.seal_type,
+              s.log_summary, s.review_status,
+              c.payload_hash AS llm_payload_hash, c.result_json AS llm_result_json
+            FROM submissions s
+            LEFT JOIN llm_cache c ON c.submission_id = s.id
+            WHERE s.created_at >= ? AND s.created_at < ?
+            ORDER BY s.created_at ASC
             """,
             (window_start_utc.isoformat(), window_end_utc.isoformat()),
         ).fetchall()
 
-        for row in rows:
-            payload = {
-                "id": row["id"],
-                "created_at": row["created_at"],
-                "player_name": row["player_name"],
-                "tier": row["tier"],
-                "run_date": row["run_date"],
-                "start_time": row["start_time"],
-                "distance_km": row["distance_km"],
-                "duration_min": row["duration_min"],
-                "claimed_labels": json.loads(row["claimed_labels_json"] or "[]"),
-                "resolved_codes": json.loads(row["resolved_codes_json"] or "[]"),
-                "validation": json.loads(row["validation_json"] or "{}"),
-                "notes": row["notes"],
-                "token": {
-                    "event": row["token_event"],
-                    "hold": row["token_hold"],
-                    "seal_target": row["seal_target"],
-                    "seal_type": row["seal_type"],
-                    "log_summary": row["log_summary"],
-                },
-                "review_status": row["review_status"] or "pending",
-            }
-            llm_result = preprocess_submission(payload)
-            items.append(
-                {
+        def preprocess_items() -> Iterator[dict[str, Any]]:
+            for row in rows:
+                payload = {
+                    "id": row["id"],
+                    "created_at": row["created_at"],
+                    "player_name": row["player_name"],
+                    "tier": row["tier"],
+                    "run_date": row["run_date"],
+                    "start_time": row["start_time"],
+                    "distance_km": row["distance_km"],
+                    "duration_min": row["duration_min"],
+                    "claimed_labels": json.loads(row["claimed_labels_json"] or "[]"),
+                    "resolved_codes": json.loads(row["resolved_codes_json"] or "[]"),
+                    "validation": json.loads(row["validation_json"] or "{}"),
+                    "notes": row["notes"],
+                    "token": {
+                        "event": row["token_event"],
+                        "hold": row["token_hold"],
+                        "seal_target": row["seal_target"],
+                        "seal_type": row["seal_type"],
+                        "log_summary": row["log_summary"],
+                    },
+                    "review_status": row["review_status"] or "pending",
+                }
+                payload_hash = _payload_hash(
+                    [*row[:PREPROCESS_PAYLOAD_COLUMNS - 1], payload["review_status"], llm_identity]
+                )
+                if row["llm_result_json"] and row["llm_payload_hash"] == payload_hash:
+                    llm_result = json.loads(row["llm_result_json"])
+                else:
+                    llm_result = preprocess_submission(payload)
+                    # "skipped" means no provider ran; don't pin that once an LLM gets configured.
+                    if llm_result.get("status") != "skipped":
+                        new_llm_rows.append((row["id"], payload_hash, json.dumps(llm_result, ensure_ascii=False)))
+                yield {
                     "submission": payload,
                     "llm": llm_result,
                 }
-            )
-            if row["review_status"] is None:
-                con.execute(
-                    "UPDATE submissions SET review_status = 'pending' WHERE id = ? AND review_status IS NULL",
-                    (row["id"],),
-                )
-        con.commit()
-    finally:
-        con.close()
 
-    out_dir = storage_dir / "preprocess"
-    out_dir.mkdir(parents=True, exist_ok=True)
-    label = window_start.date().isoformat()
-    out_path = out_dir / f"{label}.json"
-    out_path.write_text(
-        json.dumps(
+        _write_json_items(
+            out_path,
             {
                 "generated_at": now.isoformat(),
                 "window": {"start": window_start.isoformat(), "end": window_end.isoformat()},
-                "items": items,
             },
-            ensure_ascii=False,
-            indent=2,
-        ),
-        encoding="utf-8",
-    )
+            "items",
+            preprocess_items(),
+        )
+
+        # Take the write lock only after the (possibly slow) per-item preprocessing is done.
+        pending_ids = [row["id"] for row in rows if row["review_status"] is None]
+        if pending_ids or new_llm_rows:
+            con.execute("BEGIN IMMEDIATE")
+            try:
+                con.executemany(
+                    "INSERT OR REPLACE INTO llm_cache (submission_id, payload_hash, result_json) VALUES (?, ?, ?)",
+                    new_llm_rows,
+                )
+                # Chunked so a large window stays under SQLite's bound-parameter limit.
+                for i in range(0, len(pending_ids), SQL_IN_CHUNK):
+                    chunk = pending_ids[i : i + SQL_IN_CHUNK]
+                    placeholders = ",".join("?" * len(chunk))
+                    con.execute(
+                        f"UPDATE submissions SET review_status = 'pending' WHERE id IN ({placeholders}) AND review_status IS NULL",
+                        chunk,
+                    )
+            except BaseException:
+                con.execute("ROLLBACK")
+                raise
+            con.execute("COMMIT")
 
     state = _load_state(state_path)
     state["last_preprocess"] = now.isoformat()
@@ -177,24 +371,24 @@ def run_preprocess(*, storage_dir: Path, tz: ZoneInfo, cutoff: dt_time) -> Path:
     return out_path
 
 
-def _board_lines(grid: list[list[str | None]]) -> list[list[str]]:
-    lines: list[list[str]] = []
+def _board_cells(grid: list[list[str | None]]) -> list[str | None] | None:
+    # Row-major 25 codes, so cell (r, c) is bit r * 5 + c of a board mask.
     if len(grid) != 5 or any(len(row) != 5 for row in grid):
-        return lines
-    for row in grid:
-        if all(row):
-            lines.append([c for c in row if c])
-    for col in range(5):
-        col_vals = [grid[row][col] for row in range(5)]
-        if all(col_vals):
-            lines.append([c for c in col_vals if c])
-    diag1 = [grid[i][i] for i in range(5)]
-    diag2 = [grid[i][4 - i] for i in range(5)]
-    if all(diag1):
-        lines.append([c for c in diag1 if c])
-    if all(diag2):
-        lines.append([c for c in diag2 if c])
-    return lines
+        return None
+    return [code for row in grid for code in row]
+
+
+def _board_code_bits(cells: list[str | None]) -> dict[str, int]:
+    # code -> the bits of every cell holding it.
+    bits: dict[str, int] = {}
+    for i, code in enumerate(cells):
+        if code:
+            bits[code] = bits.get(code, 0) | 1 << i
+    return bits
+
+
+def _bingo_count(mask: int) -> int:
+    return sum(1 for line_mask in BINGO_LINE_MASKS if mask & line_mask == line_mask)
 
 
 def run_publish(*, storage_dir: Path, tz: ZoneInfo, seed: str) -> Path:
@@ -203,138 +397,137 @@ def run_publish(*, storage_dir: Path, tz: ZoneInfo, seed: str) -> Path:
     now = datetime.now(tz)
 
     boards_path = Path(os.getenv("MRC_BOARDS_PATH") or (storage_dir / "boards" / "boards.json"))
-    carddeck_path = Path(os.getenv("MRC_CARDDECK_PATH", str(Path(__file__).resolve().parents[1] / "CardDeck.md")))
+    carddeck_path = Path(os.getenv("MRC_CARDDECK_PATH", str(DEFAULT_CARDDECK_PATH)))
     map_labels = (os.getenv("MRC_BOARD_LABEL_MAP") or "").strip().lower() in ("1", "true", "yes", "on")
-    boards_data = load_boards_json(
-        boards_path,
-        carddeck_path=carddeck_path,
-        label_seed=seed,
-        apply_label_map=map_labels,
-    ) or {}
-    board_index: dict[str, dict[str, Any]] = {}
-    board_tiers: dict[str, str] = {}
-    for board in boards_data.get("boards", []) if isinstance(boards_data, dict) else []:
-        if not board:
-            continue
-        name = board.get("name")
-        if not name:
-            continue
-        board_index[name] = board
-        board_tier = _normalize_tier(board.get("tier") or board.get("tier_label"))
-        if board_tier:
-            board_tiers[name] = board_tier
-
-    board_lines_by_name: dict[str, list[list[str]]] = {}
-    board_codes_by_name: dict[str, set[str]] = {}
-    for name, board in board_index.items():
-        grid = [
-            [cell.get("code") if cell else None for cell in row_cells]
-            for row_cells in board.get("grid", [])
-        ]
-        board_lines_by_name[name] = _board_lines(grid)
-        board_codes_by_name[name] = {
-            cell.get("code")
-            for row_cells in board.get("grid", [])
-            for cell in row_cells
-            if cell and cell.get("code")
-        }
+    board_index, board_tiers, board_code_bits_by_name, board_codes_by_name = _cached_board_tables(
+        str(boards_path),
+        _mtime_ns(boards_path),
+        str(carddeck_path),
+        _mtime_ns(carddeck_path),
+        seed,
+        map_labels,
+    )
 
     w_codes = {code for code, card in CARDS.items() if card.card_type == "W"}
     players: dict[str, dict[str, Any]] = {}
-    attack_logs: list[dict[str, Any]] = []
-    latest_logs: list[dict[str, Any]] = []
 
-    con = sqlite3.connect(db_path)
-    con.row_factory = sqlite3.Row
-    try:
-        rows = con.execute(
-            """
-            SELECT
-              id, created_at, player_name, tier, resolved_codes_json,
-              token_event, token_hold, seal_target, seal_type, log_summary,
-              review_status, review_cards_json
-            FROM submissions
-            WHERE review_status IN ('approved', 'pending')
-            ORDER BY created_at ASC
-            """
-        ).fetchall()
+    with _job_connection(db_path) as con:
+        # One read transaction, so the timeline, token spend and both feeds see the same WAL snapshot.
+        con.execute("BEGIN")
+        try:
+            # SQLite's JSON1 picks each row's counted codes: the approved keys of a non-empty review_cards
+            # object, else resolved_codes for an approved row, else none. They come back joined by
+            # CODE_LIST_SEP (NULL when empty).
+            rows = con.execute(
+                """
+                SELECT
+                  created_at, player_name, tier,
+                  CASE
+                    WHEN json_valid(review_cards_json) AND json_type(review_cards_json) = 'object'
+                         AND json(review_cards_json) != '{}'
+                      THEN (
+                        SELECT group_concat(rc.key, char(31))
+                        FROM json_each(review_cards_json) rc
+                        WHERE rc.value = 'approved'
+                      )
+                    WHEN review_status = 'approved'
+                      THEN (SELECT group_concat(je.value, char(31)) FROM json_each(NULLIF(resolved_codes_json, '')) je)
+                  END AS approved_codes
+                FROM submissions
+                WHERE review_status IN ('approved', 'pending') AND player_name != ''
+                ORDER BY created_at ASC
+                """
+            ).fetchall()
+            token_used_by_name = dict(
+                con.execute(
+                    """
+                    SELECT player_name, COUNT(*)
+                    FROM submissions
+                    WHERE review_status = 'approved' AND token_event IN ('seal', 'shield') AND player_name != ''
+                    GROUP BY player_name
+                    """
+                ).fetchall()
+            )
+            attack_rows = con.execute(
+                f"""
+                SELECT created_at, player_name, seal_target, seal_type
+                FROM submissions
+                WHERE review_status IN ('approved', 'pending') AND token_event = 'seal' AND player_name != ''
+                ORDER BY created_at DESC, rowid DESC
+                LIMIT {PUBLISH_LOG_LIMIT}
+                """
+            ).fetchall()
+            log_rows = con.execute(
+                f"""
+                SELECT created_at, player_name, log_summary
+                FROM submissions
+                WHERE review_status IN ('approved', 'pending') AND log_summary != '' AND player_name != ''
+                ORDER BY created_at DESC, rowid DESC
+                LIMIT {PUBLISH_LOG_LIMIT}
+                """
+            ).fetchall()
+        finally:
+            con.execute("COMMIT")
 
         for row in rows:
             name = row["player_name"]
-            if not name:
-                continue
-            player = players.setdefault(
-                name,
-                {
+            player = players.get(name)
+            if player is None:
+                player = players[name] = {
                     "id": f"player-{_stable_id(name)}",
                     "name": name,
                     "tier": board_tiers.get(name) or row["tier"],
                     "codes": set(),
+                    "mask": 0,
                     "w_codes": set(),
                     "token_used": 0,
                     "last_update": None,
                     "bingo5_at": None,
                     "full_at": None,
-                },
-            )
+                }
 
             created_at = _iso_to_dt(row["created_at"])
-            created_local = created_at.astimezone(tz).isoformat() if created_at else row["created_at"]
             if created_at and (player["last_update"] is None or created_at > player["last_update"]):
                 player["last_update"] = created_at
 
-            codes = json.loads(row["resolved_codes_json"] or "[]")
-            try:
-                review_cards = json.loads(row["review_cards_json"] or "{}")
-            except json.JSONDecodeError:
-                review_cards = {}
-            if review_cards:
-                approved_codes = [code for code, status in review_cards.items() if status == "approved"]
-            elif row["review_status"] != "approved":
-                approved_codes = []
-            else:
-                approved_codes = codes
-            codes = approved_codes
+            approved_codes = row["approved_codes"]
+            codes = approved_codes.split(CODE_LIST_SEP) if approved_codes is not None else []
             board_codes = board_codes_by_name.get(name)
             if board_codes:
                 codes = [c for c in codes if c in board_codes]
             player["codes"].update(codes)
             player["w_codes"].update(code for code in codes if code in w_codes)
+            code_bits = board_code_bits_by_name.get(name)
+            if code_bits:
+                for code in codes:
+                    player["mask"] |= code_bits.get(code, 0)
 
             if created_at:
-                board_lines = board_lines_by_name.get(name)
-                if board_lines and player["bingo5_at"] is None:
-                    checked = player["codes"]
-                    bingo_count = sum(1 for line in board_lines if all(code in checked for code in line))
-                    if bingo_count >= 5:
-                        player["bingo5_at"] = created_at
-                if board_codes and player["full_at"] is None:
-                    checked = player["codes"]
-                    if len(checked & board_codes) >= len(board_codes):
-                        player["full_at"] = created_at
-
-            if row["review_status"] == "approved" and row["token_event"] in ("seal", "shield"):
-                player["token_used"] += 1
-
-            if row["token_event"] == "seal":
-                attack_logs.append(
-                    {
-                        "time": created_local,
-                        "actor": name,
-                        "target": row["seal_target"],
-                        "seal_type": row["seal_type"],
-                    }
-                )
-            if row["log_summary"]:
-                latest_logs.append(
-                    {
-                        "time": created_local,
-                        "player": name,
-                        "message": row["log_summary"],
-                    }
-                )
-    finally:
-        con.close()
+                if code_bits and player["bingo5_at"] is None and _bingo_count(player["mask"]) >= 5:
+                    player["bingo5_at"] = created_at
+                if board_codes and player["full_at"] is None and board_codes.issubset(player["codes"]):
+                    player["full_at"] = created_at
+
+    for name, used in token_used_by_name.items():
+        if name in players:
+            players[name]["token_used"] = used
+    attack_logs = [
+        {
+            "time": _local_iso(row["created_at"], tz),
+            "actor": row["player_name"],
+            "target": row["seal_target"],
+            "seal_type": row["seal_type"],
+        }
+        for row in reversed(attack_rows)
+    ]
+    latest_logs = [
+        {
+            "time": _local_iso(row["created_at"], tz),
+            "player": row["player_name"],
+            "message": row["log_summary"],
+        }
+        for row in reversed(log_rows)
+    ]
 
     bingo5_times = {name: player.get("bingo5_at") for name, player in players.items() if player.get("bingo5_at")}
     full_times = {name: player.get("full_at") for name, player in players.items() if player.get("full_at")}
@@ -348,17 +541,10 @@ def run_publish(*, storage_dir: Path, tz: ZoneInfo, seed: str) -> Path:
 
     for name, player in players.items():
         checked_codes = sorted(player["codes"])
-        stars = sum(CARDS[code].stars for code in checked_codes if code in CARDS)
+        stars = sum(STARS_BY_CODE.get(code, 0) for code in checked_codes)
         board = board_index.get(name)
-        bingo = 0
-        if board:
-            grid = [
-                [cell.get("code") if cell else None for cell in row_cells]
-                for row_cells in board.get("grid", [])
-            ]
-            lines = _board_lines(grid)
-            checked = set(checked_codes)
-            bingo = sum(1 for line in lines if all(code in checked for code in line))
+        # The mask only ever gets bits from the player's own (well-formed) board; otherwise it stays 0.
+        bingo = _bingo_count(player["mask"])
         last_update = player["last_update"].astimezone(tz).isoformat() if player["last_update"] else None
         bingo5_at = player.get("bingo5_at")
         full_at = player.get("full_at")
@@ -405,24 +591,19 @@ def run_publish(*, storage_dir: Path, tz: ZoneInfo, seed: str) -> Path:
     }
 
     publish_dir = Path(os.getenv("MRC_PUBLISH_DIR") or (storage_dir / "publish"))
-    publish_dir.mkdir(parents=True, exist_ok=True)
     out_path = publish_dir / "progress.json"
-    out_path.write_text(
-        json.dumps(
-            {
-                "version": 1,
-                "seed": seed,
-                "generated_at": now.isoformat(),
-                "summary": summary,
-                "attack_logs": attack_logs[-50:],
-                "token_holds": token_holds,
-                "latest_logs": latest_logs[-50:],
-                "players": players_out,
-            },
-            ensure_ascii=False,
-            indent=2,
-        ),
-        encoding="utf-8",
+    _write_json(
+        out_path,
+        {
+            "version": 1,
+            "seed": seed,
+            "generated_at": now.isoformat(),
+            "summary": summary,
+            "attack_logs": attack_logs,
+            "token_holds": token_holds,
+            "latest_logs": latest_logs,
+            "players": players_out,
+        },
     )
 
     state = _load_state(state_path)
@@ -432,6 +613,8 @@ def run_publish(*, storage_dir: Path, tz: ZoneInfo, seed: str) -> Path:
 
 
 def main() -> None:
+    import argparse
+
     parser = argparse.ArgumentParser(description="Run preprocess/publish jobs.")
     parser.add_argument("job", choices=["preprocess", "publish"])
     args = parser.parse_args()
@@ -1,32 +1,35 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 from .cards import CARDS_BY_TYPE
 
 
 def hash_string_fnv1a_32(value: str) -> int:
+    # Hashes code points, not UTF-8 bytes, to match hashString() in docs/ (charCodeAt) for any BMP seed.
+    # For ASCII the two coincide.
     h = 2166136261
-    for ch in value:
-        h ^= ord(ch)
-        h = (h * 16777619) & 0xFFFFFFFF
-    return h & 0xFFFFFFFF
+    code_points = value.encode("ascii") if value.isascii() else map(ord, value)
+    for code_point in code_points:
+        h = ((h ^ code_point) * 16777619) & 0xFFFFFFFF
+    return h
 
 
 def mulberry32(seed: int):
     seed &= 0xFFFFFFFF
 
+    # The output sequence must not change: stored boards and resolved submission codes were derived from
+    # it. (It is not identical to docs/*.js mulberry32, whose first multiply takes `t | 1` from the
+    # pre-xor value.) Every value stays within 32 bits, so only the add and the multiplies need masking.
     def next_float() -> float:
         nonlocal seed
         seed = (seed + 0x6D2B79F5) & 0xFFFFFFFF
-        t = seed
-        t = (t ^ (t >> 15)) & 0xFFFFFFFF
-        t = (t * ((t | 1) & 0xFFFFFFFF)) & 0xFFFFFFFF
-        t2 = (t ^ (t >> 7)) & 0xFFFFFFFF
-        t2 = (t2 * ((t | 61) & 0xFFFFFFFF)) & 0xFFFFFFFF
-        t = (t ^ ((t + t2) & 0xFFFFFFFF)) & 0xFFFFFFFF
-        t = (t ^ (t >> 14)) & 0xFFFFFFFF
-        return t / 4294967296
+        t = seed ^ (seed >> 15)
+        t = (t * (t | 1)) & 0xFFFFFFFF
+        t2 = ((t ^ (t >> 7)) * (t | 61)) & 0xFFFFFFFF
+        t ^= (t + t2) & 0xFFFFFFFF
+        return (t ^ (t >> 14)) / 4294967296
 
     return next_float
 
@@ -44,6 +47,9 @@ class LabelMap:
     by_label: dict[str, str]  # back label -> mission id
 
 
+# The mapping depends only on the seed and the static card table, so each seed is shuffled once per
+# process. Callers share the returned maps and must treat them as read-only.
+@lru_cache(maxsize=8)
 def build_label_map(seed: str) -> LabelMap:
     rng = mulberry32(hash_string_fnv1a_32(seed))
     by_id: dict[str, str] = {}
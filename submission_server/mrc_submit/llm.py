@@ -4,8 +4,13 @@ import os
 from typing import Any
 
 
+def provider_identity() -> str:
+    # Preprocess cache entries are keyed on this; fold in model/prompt settings once the adapter has any.
+    return (os.getenv("MRC_LLM_PROVIDER") or "").strip().lower()
+
+
 def preprocess_submission(payload: dict[str, Any]) -> dict[str, Any]:
-    provider = (os.getenv("MRC_LLM_PROVIDER") or "").strip().lower()
+    provider = provider_identity()
     api_key = (os.getenv("MRC_LLM_API_KEY") or "").strip()
 
     if not provider or not api_key:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 import secrets
 import sqlite3
@@ -8,6 +9,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 from pathlib import Path
+from typing import Container
 
 from .cards import CARDS
 
@@ -178,6 +180,8 @@ class Storage:
     def __init__(self, base_dir: Path) -> None:
         self.base_dir = base_dir
         self.submissions_dir = self.base_dir / "submissions"
+        # Resolved once for path-traversal checks on stored file paths.
+        self.submissions_root = self.submissions_dir.resolve()
         self.db_path = self.base_dir / "index.sqlite"
 
     def init(self) -> None:
@@ -185,9 +189,16 @@ class Storage:
         self.submissions_dir.mkdir(parents=True, exist_ok=True)
         self._init_db()
 
-    def _init_db(self) -> None:
+    def _connect(self) -> sqlite3.Connection:
         con = sqlite3.connect(self.db_path)
+        # Safe with WAL: a crash keeps committed rows; only a power loss can drop the latest commits.
+        con.execute("PRAGMA synchronous=NORMAL")
+        return con
+
+    def _init_db(self) -> None:
+        con = self._connect()
         try:
+            con.execute("PRAGMA journal_mode=WAL")
             con.executescript(GAME_SCHEMA_SQL)
             con.execute(
                 """
@@ -220,6 +231,15 @@ class Storage:
                 )
                 """
             )
+            con.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                  submission_id TEXT PRIMARY KEY,
+                  payload_hash TEXT NOT NULL,
+                  result_json TEXT NOT NULL
+                )
+                """
+            )
             self._ensure_columns(
                 con,
                 {
@@ -235,6 +255,11 @@ class Storage:
                     "review_cards_json": "TEXT",
                 },
             )
+            # After _ensure_columns, so databases from before review_status existed get it first.
+            con.execute("CREATE INDEX IF NOT EXISTS idx_submissions_created_at ON submissions (created_at)")
+            con.execute(
+                "CREATE INDEX IF NOT EXISTS idx_submissions_review_created ON submissions (review_status, created_at)"
+            )
             con.commit()
         finally:
             con.close()
@@ -251,16 +276,24 @@ class Storage:
         (submission_dir / "files").mkdir(parents=True, exist_ok=False)
         return submission_dir
 
-    def save_file(self, submission_dir: Path, upload_filename: str, content: bytes) -> StoredFile:
+    def new_file_path(self, submission_dir: Path, upload_filename: str, reserved: Container[Path] = ()) -> Path:
+        # `reserved` holds paths handed out for files that have not been written yet.
         safe = _safe_name(upload_filename)
         out_path = submission_dir / "files" / safe
-        if out_path.exists():
+        if out_path.exists() or out_path in reserved:
             out_path = submission_dir / "files" / f"{secrets.token_hex(2)}_{safe}"
-        out_path.write_bytes(content)
-        return StoredFile(filename=upload_filename, stored_as=str(out_path.relative_to(submission_dir)), size_bytes=len(content))
+        return out_path
 
     def write_meta(self, submission_dir: Path, meta: dict) -> None:
-        (submission_dir / "meta.json").write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+        # Swap in a complete file so the admin detail page never reads a partial meta.json.
+        out_path = submission_dir / "meta.json"
+        tmp_path = out_path.with_name(f".{out_path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+            os.replace(tmp_path, out_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
     def insert_index(
         self,
@@ -290,8 +323,9 @@ class Storage:
         files: list[StoredFile],
         user_agent: str | None,
         client_ip: str | None,
+        supersede_run_day: str | None = None,
     ) -> None:
-        con = sqlite3.connect(self.db_path)
+        con = self._connect()
         try:
             con.execute(
                 """
@@ -331,23 +365,82 @@ class Storage:
                     client_ip,
                 ),
             )
+            if supersede_run_day:
+                self._reject_previous(
+                    con,
+                    player_name=player_name,
+                    keep_id=submission_id,
+                    run_day=supersede_run_day,
+                    reviewed_at=created_at,
+                )
             con.commit()
         finally:
             con.close()
 
-    def list_submissions(self, *, status: str | None = None, limit: int = 200) -> list[dict]:
-        con = sqlite3.connect(self.db_path)
+    @staticmethod
+    def _submission_filters(
+        status: str | None,
+        player_name: str | None = None,
+        run_date: str | None = None,
+        before: str | None = None,
+    ) -> tuple[str, list[object]]:
+        clauses = []
+        params: list[object] = []
+        if status:
+            if status == "pending":
+                clauses.append("(review_status IS NULL OR review_status = 'pending')")
+            else:
+                clauses.append("review_status = ?")
+                params.append(status)
+        if player_name:
+            clauses.append("player_name = ?")
+            params.append(player_name)
+        if run_date:
+            clauses.append("run_date = ?")
+            params.append(run_date)
+        if before:
+            clauses.append("created_at < ?")
+            params.append(before)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    # Same window as list_submissions, reduced to the two columns the admin filters and insights use.
+    def list_submission_index(self, *, status: str | None = None, limit: int = 200) -> list[dict]:
+        where, params = self._submission_filters(status)
+        con = self._connect()
+        try:
+            rows = con.execute(
+                f"SELECT player_name, run_date FROM submissions {where} ORDER BY created_at DESC LIMIT ?",
+                [*params, limit],
+            ).fetchall()
+        finally:
+            con.close()
+        return [{"player_name": player_name, "run_date": run_date} for player_name, run_date in rows]
+
+    def count_by_status(self) -> dict[str, int]:
+        con = self._connect()
+        try:
+            rows = con.execute(
+                "SELECT COALESCE(review_status, 'pending'), COUNT(*) FROM submissions GROUP BY 1"
+            ).fetchall()
+        finally:
+            con.close()
+        return {status: count for status, count in rows}
+
+    def list_submissions(
+        self,
+        *,
+        status: str | None = None,
+        player_name: str | None = None,
+        run_date: str | None = None,
+        before: str | None = None,
+        limit: int = 200,
+    ) -> list[dict]:
+        # `before` is a created_at keyset cursor: rows strictly older than it, newest first.
+        where, params = self._submission_filters(status, player_name, run_date, before)
+        con = self._connect()
         con.row_factory = sqlite3.Row
         try:
-            clauses = []
-            params: list[object] = []
-            if status:
-                if status == "pending":
-                    clauses.append("(review_status IS NULL OR review_status = 'pending')")
-                else:
-                    clauses.append("review_status = ?")
-                    params.append(status)
-            where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
             query = f"""
                 SELECT
                   id, created_at, player_name, tier, run_date, start_time,
@@ -409,7 +502,7 @@ class Storage:
         w_codes = {code for code, card in CARDS.items() if card.card_type == "W"}
         earned_codes: set[str] = set()
         used = 0
-        con = sqlite3.connect(self.db_path)
+        con = self._connect()
         con.row_factory = sqlite3.Row
         try:
             rows = con.execute(
@@ -446,7 +539,7 @@ class Storage:
         return available, earned, used
 
     def get_active_seals(self, *, player_name: str, tz: ZoneInfo) -> list[dict[str, object]]:
-        con = sqlite3.connect(self.db_path)
+        con = self._connect()
         con.row_factory = sqlite3.Row
         try:
             rows = con.execute(
@@ -530,7 +623,7 @@ class Storage:
             con.close()
 
     def has_pending_or_active_seal(self, *, seal_target: str, seal_type: str) -> bool:
-        con = sqlite3.connect(self.db_path)
+        con = self._connect()
         con.row_factory = sqlite3.Row
         try:
             row = con.execute(
@@ -558,7 +651,7 @@ class Storage:
         reviewed_by: str | None,
         review_notes: str | None,
     ) -> None:
-        con = sqlite3.connect(self.db_path)
+        con = self._connect()
         try:
             con.execute(
                 """
@@ -582,7 +675,7 @@ class Storage:
         reviewed_by: str | None,
         review_notes: str | None,
     ) -> None:
-        con = sqlite3.connect(self.db_path)
+        con = self._connect()
         con.row_factory = sqlite3.Row
         try:
             row = con.execute(
@@ -624,68 +717,62 @@ class Storage:
         finally:
             con.close()
 
-    def reject_previous_submissions(
+    def _reject_previous(
         self,
+        con: sqlite3.Connection,
         *,
         player_name: str,
         keep_id: str,
         run_day: str,
         reviewed_at: str,
     ) -> int:
-        con = sqlite3.connect(self.db_path)
-        con.row_factory = sqlite3.Row
-        try:
-            rows = con.execute(
-                """
-                SELECT id, created_at, run_date, resolved_codes_json, review_cards_json
-                FROM submissions
-                WHERE player_name = ? AND id != ?
-                """,
-                (player_name, keep_id),
-            ).fetchall()
-            if not rows:
-                return 0
-
-            tz = ZoneInfo("Asia/Seoul")
-            rejected = 0
-            for row in rows:
-                effective_day = row["run_date"]
-                if not effective_day:
-                    try:
-                        dt = datetime.fromisoformat(row["created_at"])
-                        if dt.tzinfo:
-                            dt = dt.astimezone(tz)
-                        effective_day = dt.date().isoformat()
-                    except ValueError:
-                        effective_day = None
-                if effective_day != run_day:
-                    continue
-
+        rows = con.execute(
+            """
+            SELECT id, created_at, run_date, resolved_codes_json
+            FROM submissions
+            WHERE player_name = ? AND id != ?
+            """,
+            (player_name, keep_id),
+        ).fetchall()
+        if not rows:
+            return 0
+
+        tz = ZoneInfo("Asia/Seoul")
+        updates = []
+        for row_id, created_at, run_date, resolved_codes_json in rows:
+            effective_day = run_date
+            if not effective_day:
                 try:
-                    codes = json.loads(row["resolved_codes_json"] or "[]")
-                except json.JSONDecodeError:
-                    codes = []
-                review_cards = {}
-                for code in codes:
-                    review_cards[code] = "rejected"
-
-                con.execute(
-                    """
-                    UPDATE submissions
-                    SET review_status = ?, reviewed_at = ?, reviewed_by = ?, review_notes = ?, review_cards_json = ?
-                    WHERE id = ?
-                    """,
-                    (
-                        "rejected",
-                        reviewed_at,
-                        "auto",
-                        "자동 반려: 같은 날 최신 제출만 인정",
-                        json.dumps(review_cards, ensure_ascii=False),
-                        row["id"],
-                    ),
+                    dt = datetime.fromisoformat(created_at)
+                    if dt.tzinfo:
+                        dt = dt.astimezone(tz)
+                    effective_day = dt.date().isoformat()
+                except ValueError:
+                    effective_day = None
+            if effective_day != run_day:
+                continue
+
+            try:
+                codes = json.loads(resolved_codes_json or "[]")
+            except json.JSONDecodeError:
+                codes = []
+            review_cards = {code: "rejected" for code in codes}
+            updates.append(
+                (
+                    "rejected",
+                    reviewed_at,
+                    "auto",
+                    "자동 반려: 같은 날 최신 제출만 인정",
+                    json.dumps(review_cards, ensure_ascii=False),
+                    row_id,
                 )
-                rejected += 1
-            con.commit()
-            return rejected
-        finally:
-            con.close()
+            )
+        con.executemany(
+            """
+            UPDATE submissions
+            SET review_status = ?, reviewed_at = ?, reviewed_by = ?, review_notes = ?, review_cards_json = ?
+            WHERE id = ?
+            """,
+            updates,
+        )
+        return len(updates)